@@ -7,12 +7,64 @@
 
 import os
 import re
+import sys
 import shutil
+import string
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+
+
+# Python 3.10+ 支持 dataclass(slots=True)，使用__slots__可减少每个实例的内存占用
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=128)
+def compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern":
+    """
+    编译正则表达式并缓存结果
+    
+    规则面板校验输入和引擎套用规则共用此缓存，同一模式只编译一次
+    """
+    return re.compile(pattern, flags)
+
+
+# 文件名模板支持的占位符
+_TEMPLATE_FIELDS = frozenset(("n", "ext", "name", "dir"))
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    预先解析文件名模板，返回渲染函数 render(n=..., ext=..., name=..., dir=...)
+    
+    模板只含简单占位符时按解析结果直接拼接，不必每次重新解析格式字符串；
+    含格式说明、转换标记或其他字段时退回 str.format，行为（包括报错）与其一致
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append((literal, False))
+        if field_name is None:
+            continue
+        if field_name not in _TEMPLATE_FIELDS or format_spec or conversion:
+            return template.format
+        parts.append((field_name, True))
+    
+    # 不含占位符的模板每次渲染结果相同，直接返回常量
+    if not any(is_field for _, is_field in parts):
+        constant = "".join(text for text, _ in parts)
+        return lambda **values: constant
+    
+    def render(**values) -> str:
+        return "".join(str(values[text]) if is_field else text for text, is_field in parts)
+    return render
 
 
 class RenameMode(Enum):
@@ -36,7 +88,7 @@ class CaseMode(Enum):
     SENTENCE = "sentence"        # 句首大写
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RenameRule:
     """重命名规则数据类"""
     mode: RenameMode
@@ -60,9 +112,36 @@ class RenameRule:
     # 日期时间
     date_format: str = "%Y%m%d"
     use_create_date: bool = True
+    # 编译后的正则缓存 (缓存键, 模式)，不参与初始化和比较
+    _compiled: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def cache_key(self) -> Tuple:
+        """返回由所有规则参数组成的元组，用于缓存编译结果"""
+        return tuple(getattr(self, f.name) for f in fields(self) if f.compare)
+    
+    def get_pattern(self) -> "re.Pattern":
+        """
+        获取编译后的正则表达式，按相关参数缓存，参数变化后自动重新编译
+        
+        正则模式使用regex_pattern/regex_flags，替换模式使用转义后的search_text
+        """
+        if self.mode == RenameMode.REGEX:
+            key = (self.regex_pattern, self.regex_flags)
+        else:
+            key = (self.search_text, self.case_sensitive)
+        
+        if self._compiled is None or self._compiled[0] != key:
+            if self.mode == RenameMode.REGEX:
+                pattern = compile_pattern(self.regex_pattern, self.regex_flags)
+            else:
+                flags = 0 if self.case_sensitive else re.IGNORECASE
+                pattern = compile_pattern(re.escape(self.search_text), flags)
+            self._compiled = (key, pattern)
+        
+        return self._compiled[1]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FileItem:
     """文件项数据类"""
     original_path: Path
@@ -70,10 +149,112 @@ class FileItem:
     new_name: str
     extension: str
     size: int
-    modified_date: datetime
-    created_date: datetime
+    modified_time: float   # 修改时间戳（st_mtime）
+    created_time: float    # 创建时间戳（st_ctime）
     is_directory: bool = False
     status: str = "ready"  # ready, renamed, error, skipped
+    parent_dir: str = ""   # 所在目录路径字符串（加载时缓存）
+    # 预先计算的排序键（小写文件名），加载时设置
+    _sort_key: str = field(default="", init=False, repr=False, compare=False)
+    # new_name小写形式的缓存：(_lower_source为计算缓存时的new_name对象)
+    _lower_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _lower_value: str = field(default="", init=False, repr=False, compare=False)
+    # original_name小写形式的缓存：(_name_lower_source为计算缓存时的original_name对象)
+    _name_lower_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _name_lower_value: str = field(default="", init=False, repr=False, compare=False)
+    # original_path字符串形式的缓存：(_path_source为计算缓存时的original_path对象)
+    _path_source: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    _path_value: str = field(default="", init=False, repr=False, compare=False)
+    
+    @property
+    def path_str(self) -> str:
+        """original_path的字符串形式，路径对象未被替换时复用缓存结果"""
+        if self._path_source is not self.original_path:
+            self._path_source = self.original_path
+            self._path_value = str(self.original_path)
+        return self._path_value
+    
+    @property
+    def original_name_lower(self) -> str:
+        """original_name的小写形式，重命名或刷新改变原文件名后自动重新计算"""
+        if self._name_lower_source is not self.original_name:
+            self._name_lower_source = self.original_name
+            self._name_lower_value = self.original_name.lower()
+        return self._name_lower_value
+    
+    @property
+    def new_name_lower(self) -> str:
+        """new_name的小写形式，new_name未被重新赋值时复用缓存结果"""
+        if self._lower_source is not self.new_name:
+            self._lower_source = self.new_name
+            self._lower_value = self.new_name.lower()
+        return self._lower_value
+    
+    @property
+    def modified_date(self) -> datetime:
+        """修改日期，仅在需要时由时间戳转换"""
+        return datetime.fromtimestamp(self.modified_time)
+    
+    @property
+    def created_date(self) -> datetime:
+        """创建日期，仅在需要时由时间戳转换"""
+        return datetime.fromtimestamp(self.created_time)
+
+
+def _scandir_recursive(path: str, include_subdirs: bool = False):
+    """
+    使用os.scandir遍历目录，DirEntry会缓存文件类型信息，避免重复的stat调用
+    
+    Args:
+        path: 目录路径
+        include_subdirs: 是否递归进入子目录（不跟随符号链接）
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                yield entry
+                if include_subdirs and entry.is_dir() and not entry.is_symlink():
+                    yield from _scandir_recursive(entry.path, include_subdirs)
+    except PermissionError:
+        pass
+
+
+# Windows上os.rename在目标已存在时会抛出FileExistsError，可省去预先检查；
+# POSIX上rename会静默覆盖目标文件，因此仍需先检查
+RENAME_NEEDS_EXISTS_CHECK = os.name != 'nt'
+
+# 超过该数量的重命名操作才使用线程池，避免小批量时的线程开销
+PARALLEL_RENAME_THRESHOLD = 64
+
+
+def _do_rename(work_item: Tuple) -> Optional[OSError]:
+    """
+    检查目标并执行单个重命名操作，成功返回None，失败返回异常对象（供线程池调用）
+    
+    目标已存在时返回FileExistsError（仅改变大小写时允许）；检查紧挨着重命名执行，
+    同一批中前面的重命名腾出的目标名可以被后面的文件使用
+    """
+    _, old_path, new_path = work_item
+    if (RENAME_NEEDS_EXISTS_CHECK and os.path.lexists(new_path)
+            and os.path.normcase(new_path) != os.path.normcase(old_path)):
+        return FileExistsError(new_path)
+    try:
+        os.rename(old_path, new_path)
+    except OSError as e:
+        return e
+    return None
+
+
+def _split_name(name: str) -> Tuple[str, str]:
+    """
+    将文件名拆分为(主文件名, 扩展名)，与Path.stem/Path.suffix结果一致
+    
+    以点开头的隐藏文件（如 .bashrc）和以点结尾的名称视为没有扩展名
+    """
+    i = name.rfind('.')
+    if i <= 0 or i == len(name) - 1:
+        return name, ''
+    return name[:i], name[i:]
 
 
 class RenameEngine:
@@ -84,6 +265,20 @@ class RenameEngine:
         self.rules: List[RenameRule] = []
         self.history: List[Dict] = []  # 操作历史记录
         self.current_directory: Optional[Path] = None
+        # 已编译的规则流水线缓存 (规则参数键, 操作函数列表)
+        self._pipeline_cache: Optional[Tuple[Tuple, List[Callable]]] = None
+        # 规则模式 -> 操作函数生成器
+        self._dispatch: Dict[RenameMode, Callable] = {
+            RenameMode.REPLACE: self._make_replace_op,
+            RenameMode.ADD_PREFIX: self._make_add_prefix_op,
+            RenameMode.ADD_SUFFIX: self._make_add_suffix_op,
+            RenameMode.ADD_INDEX: self._make_add_index_op,
+            RenameMode.DELETE_CHARS: self._make_delete_chars_op,
+            RenameMode.REGEX: self._make_regex_op,
+            RenameMode.CASE_CHANGE: self._make_case_change_op,
+            RenameMode.EXTENSION: self._make_extension_op,
+            RenameMode.DATE_TIME: self._make_date_time_op,
+        }
         
     def load_directory(self, directory_path: str, include_subdirs: bool = False, 
                       file_filters: List[str] = None) -> List[FileItem]:
@@ -100,43 +295,71 @@ class RenameEngine:
         """
         self.current_directory = Path(directory_path)
         self.files = []
+        self.files = list(self.iter_directory(
+            str(self.current_directory), include_subdirs, file_filters
+        ))
+        
+        # 按名称排序
+        self.files.sort(key=attrgetter('_sort_key'))
+        return self.files
+    
+    def iter_directory(self, directory_path: str, include_subdirs: bool = False,
+                       file_filters: List[str] = None):
+        """
+        逐个生成目录中的文件项（按扫描顺序，不排序，不修改引擎状态）
         
-        if not self.current_directory.exists():
+        Args:
+            directory_path: 目录路径
+            include_subdirs: 是否包含子目录
+            file_filters: 文件扩展名筛选器 (如 ['.jpg', '.png'])
+        
+        Yields:
+            文件项
+        """
+        if not os.path.exists(directory_path):
             raise FileNotFoundError(f"目录不存在: {directory_path}")
         
-        # 获取文件列表
-        if include_subdirs:
-            pattern = "**/*"
-        else:
-            pattern = "*"
-            
-        for item_path in self.current_directory.glob(pattern):
-            if item_path.is_file() or item_path.is_dir():
+        # 扩展名筛选器只需小写化一次
+        filter_set = None
+        if file_filters is not None:
+            filter_set = frozenset(f.lower() for f in file_filters)
+        
+        for entry in _scandir_recursive(directory_path, include_subdirs):
+            try:
+                is_dir = entry.is_dir()
+                if not is_dir and not entry.is_file():
+                    continue
+                
                 # 应用文件筛选器
-                if file_filters is not None and item_path.is_file():
-                    if item_path.suffix.lower() not in [f.lower() for f in file_filters]:
+                if filter_set is not None and not is_dir:
+                    if _split_name(entry.name)[1].lower() not in filter_set:
                         continue
                 
-                try:
-                    stat = item_path.stat()
-                    file_item = FileItem(
-                        original_path=item_path,
-                        original_name=item_path.name,
-                        new_name=item_path.name,
-                        extension=item_path.suffix,
-                        size=stat.st_size if item_path.is_file() else 0,
-                        modified_date=datetime.fromtimestamp(stat.st_mtime),
-                        created_date=datetime.fromtimestamp(stat.st_ctime),
-                        is_directory=item_path.is_dir()
-                    )
-                    self.files.append(file_item)
-                except (OSError, PermissionError) as e:
-                    print(f"无法访问文件: {item_path}, 错误: {e}")
-                    continue
-        
-        # 按名称排序
-        self.files.sort(key=lambda x: x.original_name.lower())
-        return self.files
+                stat = entry.stat()
+                path = Path(entry.path)
+                file_item = FileItem(
+                    original_path=path,
+                    original_name=entry.name,
+                    new_name=entry.name,
+                    extension=_split_name(entry.name)[1],
+                    size=0 if is_dir else stat.st_size,
+                    modified_time=stat.st_mtime,
+                    created_time=stat.st_ctime,
+                    is_directory=is_dir,
+                    parent_dir=os.path.dirname(entry.path)
+                )
+                file_item._sort_key = entry.name.lower()
+                # 未修改的新文件名与原文件名是同一对象，可直接复用排序键作为两者的小写缓存
+                file_item._lower_source = entry.name
+                file_item._lower_value = file_item._sort_key
+                file_item._name_lower_source = entry.name
+                file_item._name_lower_value = file_item._sort_key
+                file_item._path_source = path
+                file_item._path_value = str(path)
+                yield file_item
+            except (OSError, PermissionError) as e:
+                print(f"无法访问文件: {entry.path}, 错误: {e}")
+                continue
     
     def add_rule(self, rule: RenameRule):
         """添加重命名规则"""
@@ -151,191 +374,237 @@ class RenameEngine:
         """清空所有规则"""
         self.rules.clear()
     
+    def reset_preview(self):
+        """将所有文件的新文件名恢复为原文件名，状态恢复为ready"""
+        for file_item in self.files:
+            file_item.new_name = file_item.original_name
+            file_item.status = "ready"
+    
     def preview_rename(self) -> List[FileItem]:
         """
         预览重命名结果，不实际执行重命名
         
+        所有启用的规则先编译为操作函数，然后对每个文件依次应用全部规则，
+        每个文件只拆分一次文件名、只写入一次new_name
+        
         Returns:
             预览后的文件列表
         """
-        # 重置所有文件的新名称
-        for file_item in self.files:
-            file_item.new_name = file_item.original_name
-            file_item.status = "ready"
+        pipeline = self._build_pipeline()
         
-        # 按顺序应用所有启用的规则
-        for rule in self.rules:
-            if rule.enabled:
-                self._apply_rule_to_files(rule)
+        if not pipeline:
+            # 没有有效规则时无需拆分文件名
+            self.reset_preview()
+        else:
+            # 热点循环：将全局函数绑定为局部变量，减少解释器查找开销
+            split_name = _split_name
+            for i, file_item in enumerate(self.files):
+                base_stem, base_ext = stem, ext = split_name(file_item.original_name)
+                for op in pipeline:
+                    stem, ext = op(stem, ext, i, file_item)
+                if stem is base_stem and ext is base_ext:
+                    # 没有规则修改该文件（str.replace/Pattern.sub无匹配时返回原对象），
+                    # 直接复用原文件名，后续比较可通过对象同一性快速判断
+                    file_item.new_name = file_item.original_name
+                else:
+                    file_item.new_name = stem + ext
+                file_item.status = "ready"
         
         # 检查名称冲突
         self._check_name_conflicts()
         
         return self.files
     
-    def _apply_rule_to_files(self, rule: RenameRule):
-        """将规则应用到所有文件"""
-        if rule.mode == RenameMode.REPLACE:
-            self._apply_replace_rule(rule)
-        elif rule.mode == RenameMode.ADD_PREFIX:
-            self._apply_add_prefix_rule(rule)
-        elif rule.mode == RenameMode.ADD_SUFFIX:
-            self._apply_add_suffix_rule(rule)
-        elif rule.mode == RenameMode.ADD_INDEX:
-            self._apply_add_index_rule(rule)
-        elif rule.mode == RenameMode.DELETE_CHARS:
-            self._apply_delete_chars_rule(rule)
-        elif rule.mode == RenameMode.REGEX:
-            self._apply_regex_rule(rule)
-        elif rule.mode == RenameMode.CASE_CHANGE:
-            self._apply_case_change_rule(rule)
-        elif rule.mode == RenameMode.EXTENSION:
-            self._apply_extension_rule(rule)
-        elif rule.mode == RenameMode.DATE_TIME:
-            self._apply_date_time_rule(rule)
-    
-    def _apply_replace_rule(self, rule: RenameRule):
-        """应用替换规则"""
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            
-            if rule.case_sensitive:
-                new_name = name_without_ext.replace(rule.search_text, rule.replace_text)
-            else:
-                # 不区分大小写的替换
-                pattern = re.escape(rule.search_text)
-                new_name = re.sub(pattern, rule.replace_text, name_without_ext, flags=re.IGNORECASE)
+    def _build_pipeline(self) -> List[Callable]:
+        """
+        将所有启用的规则编译为操作函数列表
+        
+        每个操作函数的签名为 op(stem, ext, index, file_item) -> (stem, ext)，
+        规则参数在编译时绑定到闭包中，不产生任何效果的规则不会加入列表。
+        规则参数未变化时直接复用上一次的编译结果
+        """
+        enabled_rules = [rule for rule in self.rules if rule.enabled]
+        key = tuple(rule.cache_key() for rule in enabled_rules)
+        if self._pipeline_cache is not None and self._pipeline_cache[0] == key:
+            return self._pipeline_cache[1]
+        
+        pipeline = []
+        for rule in enabled_rules:
+            op = self._make_rule_op(rule)
+            if op is not None:
+                pipeline.append(op)
+        
+        self._pipeline_cache = (key, pipeline)
+        return pipeline
+    
+    def _make_rule_op(self, rule: RenameRule) -> Optional[Callable]:
+        """根据规则模式生成操作函数"""
+        factory = self._dispatch.get(rule.mode)
+        if factory is None:
+            return None
+        return factory(rule)
+    
+    def _make_replace_op(self, rule: RenameRule) -> Callable:
+        """生成替换规则操作"""
+        search_text = rule.search_text
+        replace_text = rule.replace_text
+        
+        if rule.case_sensitive:
+            def op(stem, ext, i, file_item):
+                return stem.replace(search_text, replace_text), ext
+        else:
+            # 不区分大小写的替换，模式只编译一次
+            sub = rule.get_pattern().sub
             
-            file_item.new_name = new_name + extension
+            def op(stem, ext, i, file_item):
+                return sub(replace_text, stem), ext
+        return op
     
-    def _apply_add_prefix_rule(self, rule: RenameRule):
-        """应用添加前缀规则"""
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            file_item.new_name = rule.replace_text + name_without_ext + extension
+    def _make_add_prefix_op(self, rule: RenameRule) -> Callable:
+        """生成添加前缀规则操作"""
+        prefix = rule.replace_text
+        
+        def op(stem, ext, i, file_item):
+            return prefix + stem, ext
+        return op
     
-    def _apply_add_suffix_rule(self, rule: RenameRule):
-        """应用添加后缀规则"""
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            file_item.new_name = name_without_ext + rule.replace_text + extension
+    def _make_add_suffix_op(self, rule: RenameRule) -> Callable:
+        """生成添加后缀规则操作"""
+        suffix = rule.replace_text
+        
+        def op(stem, ext, i, file_item):
+            return stem + suffix, ext
+        return op
     
-    def _apply_add_index_rule(self, rule: RenameRule):
-        """应用添加序号规则"""
-        current_number = rule.start_number
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            
+    def _make_add_index_op(self, rule: RenameRule) -> Callable:
+        """生成添加序号规则操作"""
+        template = rule.replace_text
+        start_number = rule.start_number
+        step = rule.step
+        number_format = f"0{rule.padding}d"
+        
+        # 预先按 {index} 占位符拆分模板，避免每个文件重复查找替换
+        if not template:
+            parts = None
+        elif "{index}" in template:
+            parts = template.split("{index}")
+        else:
+            parts = [template, ""]
+        
+        def op(stem, ext, i, file_item):
             # 格式化序号
-            index_str = str(current_number).zfill(rule.padding)
-            
-            if rule.replace_text:  # 如果有模板文本
-                if "{index}" in rule.replace_text:
-                    formatted_text = rule.replace_text.replace("{index}", index_str)
-                else:
-                    formatted_text = rule.replace_text + index_str
-            else:
-                formatted_text = index_str
-            
-            file_item.new_name = name_without_ext + "_" + formatted_text + extension
-            current_number += rule.step
+            index_str = format(start_number + i * step, number_format)
+            formatted_text = index_str if parts is None else index_str.join(parts)
+            return stem + "_" + formatted_text, ext
+        return op
     
-    def _apply_delete_chars_rule(self, rule: RenameRule):
-        """应用删除字符规则"""
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            
-            # 删除指定位置的字符
-            if rule.delete_start >= 0 and rule.delete_end > rule.delete_start:
-                new_name = name_without_ext[:rule.delete_start] + name_without_ext[rule.delete_end:]
-            else:
-                new_name = name_without_ext
-            
-            file_item.new_name = new_name + extension
+    def _make_delete_chars_op(self, rule: RenameRule) -> Optional[Callable]:
+        """生成删除字符规则操作"""
+        delete_start = rule.delete_start
+        delete_end = rule.delete_end
+        
+        # 删除范围无效时规则不产生效果
+        if delete_start < 0 or delete_end <= delete_start:
+            return None
+        
+        def op(stem, ext, i, file_item):
+            return stem[:delete_start] + stem[delete_end:], ext
+        return op
     
-    def _apply_regex_rule(self, rule: RenameRule):
-        """应用正则表达式规则"""
+    def _make_regex_op(self, rule: RenameRule) -> Optional[Callable]:
+        """生成正则表达式规则操作"""
         try:
-            pattern = re.compile(rule.regex_pattern, rule.regex_flags)
-            for file_item in self.files:
-                name_without_ext = Path(file_item.new_name).stem
-                extension = Path(file_item.new_name).suffix
-                
-                new_name = pattern.sub(rule.replace_text, name_without_ext)
-                file_item.new_name = new_name + extension
+            sub = rule.get_pattern().sub
         except re.error as e:
             print(f"正则表达式错误: {e}")
+            return None
+        
+        replace_text = rule.replace_text
+        
+        def op(stem, ext, i, file_item):
+            return sub(replace_text, stem), ext
+        return op
     
-    def _apply_case_change_rule(self, rule: RenameRule):
-        """应用大小写转换规则"""
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            
-            if rule.case_mode == CaseMode.UPPER:
-                new_name = name_without_ext.upper()
-            elif rule.case_mode == CaseMode.LOWER:
-                new_name = name_without_ext.lower()
-            elif rule.case_mode == CaseMode.TITLE:
-                new_name = name_without_ext.title()
-            elif rule.case_mode == CaseMode.SENTENCE:
-                new_name = name_without_ext.capitalize()
-            else:
-                new_name = name_without_ext
-            
-            file_item.new_name = new_name + extension
+    def _make_case_change_op(self, rule: RenameRule) -> Optional[Callable]:
+        """生成大小写转换规则操作"""
+        convert = {
+            CaseMode.UPPER: str.upper,
+            CaseMode.LOWER: str.lower,
+            CaseMode.TITLE: str.title,
+            CaseMode.SENTENCE: str.capitalize
+        }.get(rule.case_mode)
+        
+        if convert is None:
+            return None
+        
+        def op(stem, ext, i, file_item):
+            return convert(stem), ext
+        return op
     
-    def _apply_extension_rule(self, rule: RenameRule):
-        """应用扩展名修改规则"""
-        for file_item in self.files:
-            if not file_item.is_directory:
-                name_without_ext = Path(file_item.new_name).stem
-                new_extension = rule.replace_text
-                if not new_extension.startswith('.'):
-                    new_extension = '.' + new_extension
-                file_item.new_name = name_without_ext + new_extension
-    
-    def _apply_date_time_rule(self, rule: RenameRule):
-        """应用日期时间规则"""
-        for file_item in self.files:
-            name_without_ext = Path(file_item.new_name).stem
-            extension = Path(file_item.new_name).suffix
-            
+    def _make_extension_op(self, rule: RenameRule) -> Callable:
+        """生成扩展名修改规则操作"""
+        new_extension = rule.replace_text
+        if not new_extension.startswith('.'):
+            new_extension = '.' + new_extension
+        
+        def op(stem, ext, i, file_item):
+            # 文件夹不修改扩展名
+            if file_item.is_directory:
+                return stem, ext
+            return stem, new_extension
+        return op
+    
+    def _make_date_time_op(self, rule: RenameRule) -> Callable:
+        """生成日期时间规则操作"""
+        template = rule.replace_text
+        date_format = rule.date_format
+        use_create_date = rule.use_create_date
+        
+        # 预先按 {date} 占位符拆分模板，没有占位符时日期放在模板前面
+        if not template:
+            parts = None
+        elif "{date}" in template:
+            parts = template.split("{date}")
+        else:
+            parts = ["", "_" + template]
+        
+        def op(stem, ext, i, file_item):
             # 选择使用创建日期还是修改日期
-            target_date = file_item.created_date if rule.use_create_date else file_item.modified_date
-            date_str = target_date.strftime(rule.date_format)
-            
-            if rule.replace_text:
-                if "{date}" in rule.replace_text:
-                    formatted_text = rule.replace_text.replace("{date}", date_str)
-                else:
-                    formatted_text = date_str + "_" + rule.replace_text
-            else:
-                formatted_text = date_str
-            
-            file_item.new_name = formatted_text + "_" + name_without_ext + extension
+            target_date = file_item.created_date if use_create_date else file_item.modified_date
+            date_str = target_date.strftime(date_format)
+            formatted_text = date_str if parts is None else date_str.join(parts)
+            return formatted_text + "_" + stem, ext
+        return op
     
     def _check_name_conflicts(self):
-        """检查文件名冲突"""
-        name_counts = {}
-        for file_item in self.files:
-            lower_name = file_item.new_name.lower()
-            if lower_name in name_counts:
-                name_counts[lower_name] += 1
-                file_item.status = "conflict"
-            else:
-                name_counts[lower_name] = 1
+        """检查文件名冲突（不区分大小写）"""
+        lowered = [file_item.new_name_lower for file_item in self.files]
+        name_counts = Counter(lowered)
         
         # 标记所有冲突的文件
-        for file_item in self.files:
-            if name_counts.get(file_item.new_name.lower(), 0) > 1:
+        for file_item, lower_name in zip(self.files, lowered):
+            if name_counts[lower_name] > 1:
                 file_item.status = "conflict"
     
+    @staticmethod
+    def _needs_serial_renames(work: List[Tuple]) -> bool:
+        """
+        本批重命名是否必须按顺序串行执行
+        
+        目标名同时是另一个文件的原名（结果依赖执行顺序），或多个文件的目标名相同时
+        （线程之间的存在检查和重命名会竞争，POSIX上后一次rename会静默覆盖前一个文件）
+        """
+        sources = {os.path.normcase(old_path) for _, old_path, _ in work}
+        targets = set()
+        for _, old_path, new_path in work:
+            target = os.path.normcase(new_path)
+            if target in targets:
+                return True
+            if target in sources and target != os.path.normcase(old_path):
+                return True
+            targets.add(target)
+        return False
+    
     def execute_rename(self) -> Tuple[int, int, List[str]]:
         """
         执行重命名操作
@@ -348,6 +617,8 @@ class RenameEngine:
         error_messages = []
         rename_operations = []  # 用于撤销操作
         
+        # 先筛出需要重命名的文件
+        work = []
         for file_item in self.files:
             if file_item.status == "conflict":
                 error_messages.append(f"跳过冲突文件: {file_item.original_name}")
@@ -357,38 +628,48 @@ class RenameEngine:
             if file_item.new_name == file_item.original_name:
                 continue  # 名称未改变，跳过
             
-            try:
-                old_path = file_item.original_path
-                new_path = old_path.parent / file_item.new_name
-                
-                # 检查目标文件是否已存在
-                if new_path.exists() and new_path != old_path:
-                    error_messages.append(f"目标文件已存在: {file_item.new_name}")
-                    file_item.status = "error"
-                    error_count += 1
-                    continue
-                
-                # 执行重命名
-                old_path.rename(new_path)
-                
-                # 记录操作用于撤销
-                rename_operations.append({
-                    'old_path': new_path,
-                    'new_path': old_path,
-                    'original_name': file_item.original_name,
-                    'new_name': file_item.new_name
-                })
-                
-                file_item.status = "renamed"
-                file_item.original_path = new_path
-                file_item.original_name = file_item.new_name
-                file_item.new_name = file_item.new_name  # 保持一致性
-                success_count += 1
-                
-            except (OSError, PermissionError) as e:
-                error_messages.append(f"重命名失败 {file_item.original_name}: {str(e)}")
+            # 直接使用字符串路径，避免在循环中构造Path对象
+            old_path = file_item.path_str
+            parent_dir = file_item.parent_dir or os.path.dirname(old_path)
+            new_path = os.path.join(parent_dir, file_item.new_name)
+            work.append((file_item, old_path, new_path))
+        
+        # 执行重命名：重命名是释放GIL的IO操作，大批量时使用线程池并行；
+        # 但若某个目标名正是本批中另一个文件的原名（如 1→0、2→1）或目标名重复，只能按顺序串行
+        if len(work) > PARALLEL_RENAME_THRESHOLD and not self._needs_serial_renames(work):
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_do_rename, work))
+        else:
+            results = [_do_rename(work_item) for work_item in work]
+        
+        # 按原始顺序汇总结果，保证历史记录顺序不变
+        for (file_item, old_path, new_path), error in zip(work, results):
+            if isinstance(error, FileExistsError):
+                error_messages.append(f"目标文件已存在: {file_item.new_name}")
                 file_item.status = "error"
                 error_count += 1
+                continue
+            
+            if error is not None:
+                error_messages.append(f"重命名失败 {file_item.original_name}: {str(error)}")
+                file_item.status = "error"
+                error_count += 1
+                continue
+            
+            # 记录操作用于撤销
+            new_path_obj = Path(new_path)
+            rename_operations.append({
+                'old_path': new_path_obj,
+                'new_path': file_item.original_path,
+                'original_name': file_item.original_name,
+                'new_name': file_item.new_name
+            })
+            
+            file_item.status = "renamed"
+            file_item.original_path = new_path_obj
+            file_item.original_name = file_item.new_name
+            success_count += 1
         
         # 保存到历史记录
         if rename_operations:
@@ -417,22 +698,29 @@ class RenameEngine:
         success_count = 0
         error_count = 0
         
+        # 按当前路径索引文件项，撤销后直接原地更新，无需重新扫描整个目录
+        by_path = {file_item.original_path: file_item for file_item in self.files}
+        
         # 逆向执行重命名操作
         for op in reversed(operations):
             try:
                 if op['old_path'].exists():
                     op['old_path'].rename(op['new_path'])
                     success_count += 1
+                    
+                    file_item = by_path.get(op['old_path'])
+                    if file_item is not None:
+                        file_item.original_path = op['new_path']
+                        file_item.original_name = op['new_path'].name
+                        file_item.new_name = file_item.original_name
+                        file_item.extension = _split_name(file_item.original_name)[1]
+                        file_item.status = "ready"
             except (OSError, PermissionError) as e:
                 error_count += 1
         
         # 从历史记录中移除
         self.history.pop()
         
-        # 刷新文件列表
-        if self.current_directory:
-            self.load_directory(str(self.current_directory))
-        
         if error_count == 0:
             return True, f"成功撤销 {success_count} 个文件的重命名"
         else:
@@ -461,6 +749,9 @@ class RenameEngine:
                 # 文件夹清空名称
                 file_item.new_name = ""
             file_item.status = "ready"
+        
+        # 扩展名相同的文件会得到相同的新文件名，标记为冲突
+        self._check_name_conflicts()
     
     def generate_new_filenames(self, template: str, start_number: int = 1, step: int = 1, padding: int = 3):
         """
@@ -479,26 +770,34 @@ class RenameEngine:
         if not template.strip():
             return
         
+        render = compile_template(template)
         current_number = start_number
+        # 父目录名称缓存：同一目录下的文件共享同一个名称，只需计算一次
+        dir_names = {}
         
         for file_item in self.files:
+            parent_dir = file_item.parent_dir or os.path.dirname(file_item.path_str)
+            dir_name = dir_names.get(parent_dir)
+            if dir_name is None:
+                dir_name = dir_names[parent_dir] = os.path.basename(parent_dir)
+            
             if file_item.is_directory:
                 # 文件夹处理
-                new_name = template.format(
+                new_name = render(
                     n=current_number,
                     ext="",
                     name=file_item.original_name,
-                    dir=file_item.original_path.parent.name
+                    dir=dir_name
                 )
                 file_item.new_name = new_name
             else:
                 # 文件处理
-                original_name_without_ext = file_item.original_path.stem
-                new_name = template.format(
+                original_name_without_ext = _split_name(file_item.original_name)[0]
+                new_name = render(
                     n=str(current_number).zfill(padding),
                     ext=file_item.extension,
                     name=original_name_without_ext,
-                    dir=file_item.original_path.parent.name
+                    dir=dir_name
                 )
                 file_item.new_name = new_name
             
@@ -513,26 +812,41 @@ class RenameEngine:
         if not self.current_directory:
             return
         
-        # 重新扫描目录
+        # 每个父目录只扫描一次，按完整路径索引DirEntry（stat结果由DirEntry缓存）
+        # 两侧路径都规范为绝对路径并统一大小写，以相对路径加载的目录也能匹配
+        def path_key(path: str) -> str:
+            return os.path.normcase(os.path.abspath(path))
+        
+        entries = {}
+        for parent in {str(file_item.original_path.parent) for file_item in self.files}:
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        entries[path_key(entry.path)] = entry
+            except OSError:
+                continue
+        
         for file_item in self.files:
-            if file_item.original_path.exists():
-                # 更新文件信息
-                try:
-                    stat = file_item.original_path.stat()
-                    file_item.size = stat.st_size if file_item.original_path.is_file() else 0
-                    file_item.modified_date = datetime.fromtimestamp(stat.st_mtime)
-                    file_item.created_date = datetime.fromtimestamp(stat.st_ctime)
-                    
-                    # 如果文件路径或名称发生变化，更新相关信息
-                    current_name = file_item.original_path.name
-                    if current_name != file_item.original_name:
-                        file_item.original_name = current_name
-                        file_item.new_name = current_name
-                        file_item.extension = file_item.original_path.suffix
-                        file_item.status = "ready"
-                except (OSError, PermissionError):
-                    # 文件可能已被删除或无法访问
-                    file_item.status = "error"
-            else:
+            entry = entries.get(path_key(file_item.path_str))
+            if entry is None:
                 # 文件不存在
                 file_item.status = "error"
+                continue
+            
+            # 更新文件信息
+            try:
+                stat = entry.stat()
+                file_item.size = stat.st_size if entry.is_file() else 0
+                file_item.modified_time = stat.st_mtime
+                file_item.created_time = stat.st_ctime
+                
+                # 如果文件路径或名称发生变化，更新相关信息
+                current_name = entry.name
+                if current_name != file_item.original_name:
+                    file_item.original_name = current_name
+                    file_item.new_name = current_name
+                    file_item.extension = _split_name(current_name)[1]
+                    file_item.status = "ready"
+            except (OSError, PermissionError):
+                # 文件可能已被删除或无法访问
+                file_item.status = "error"
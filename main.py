@@ -13,8 +13,15 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from ui.qt_adapter import QApplication, QMessageBox, Qt, QIcon
-from ui.main_window import EnhancedMainWindow
+from ui.qt_adapter import QtBackendMissingError
+
+try:
+    from ui.qt_adapter import QApplication, QMessageBox, Qt, QIcon
+    from ui.main_window import EnhancedMainWindow
+except QtBackendMissingError as e:
+    # 没有可用的GUI框架时无法显示对话框，只能输出到控制台
+    print(f"错误：{e}")
+    sys.exit(1)
 
 
 def setup_application():
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重命名引擎测试
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rename_engine import RenameEngine, PARALLEL_RENAME_THRESHOLD
+
+
+class ExecuteRenameTest(unittest.TestCase):
+    """execute_rename 测试"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.engine = RenameEngine()
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _create_files(self, names):
+        for name in names:
+            with open(os.path.join(self.directory, name), "w"):
+                pass
+        self.engine.load_directory(self.directory)
+    
+    def test_chained_renames(self):
+        """目标名被同一批中前面的重命名腾出时应当成功"""
+        self._create_files(["1.txt", "2.txt", "3.txt"])
+        self.engine.generate_new_filenames("{n}{ext}", 0, 1, 1)
+        
+        self.assertEqual(self.engine.execute_rename(), (3, 0, []))
+        self.assertEqual(sorted(os.listdir(self.directory)), ["0.txt", "1.txt", "2.txt"])
+    
+    def test_chained_renames_above_parallel_threshold(self):
+        """大批量的链式重命名同样按顺序执行"""
+        count = PARALLEL_RENAME_THRESHOLD + 10
+        self._create_files([f"{i:03d}.txt" for i in range(1, count + 1)])
+        self.engine.generate_new_filenames("{n}{ext}", 0, 1, 3)
+        
+        self.assertEqual(self.engine.execute_rename(), (count, 0, []))
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         [f"{i:03d}.txt" for i in range(count)])
+    
+    def test_duplicate_targets_above_parallel_threshold(self):
+        """大批量文件的目标名相同时不能互相覆盖"""
+        count = PARALLEL_RENAME_THRESHOLD + 36
+        names = [f"{i:03d}.txt" for i in range(count)]
+        self._create_files(names)
+        for file_item in self.engine.files:
+            file_item.new_name = "same.txt"
+        
+        # 放大存在检查和重命名之间的时间窗口，线程之间若有竞争必然暴露
+        lexists = os.path.lexists
+        
+        def slow_lexists(path):
+            result = lexists(path)
+            time.sleep(0.001)
+            return result
+        
+        with mock.patch("core.rename_engine.os.path.lexists", slow_lexists):
+            success_count, error_count, _ = self.engine.execute_rename()
+        
+        self.assertEqual((success_count, error_count), (1, count - 1))
+        self.assertEqual(len(os.listdir(self.directory)), count)
+    
+    def test_clear_all_filenames_marks_conflicts(self):
+        """清空文件名后扩展名相同的文件标记为冲突，不执行重命名"""
+        count = PARALLEL_RENAME_THRESHOLD + 36
+        names = [f"{i:03d}.txt" for i in range(count)]
+        self._create_files(names)
+        self.engine.clear_all_filenames()
+        
+        success_count, error_count, error_messages = self.engine.execute_rename()
+        
+        self.assertEqual((success_count, error_count), (0, 0))
+        self.assertEqual(len(error_messages), count)
+        self.assertEqual(sorted(os.listdir(self.directory)), names)
+    
+    def test_existing_target_is_rejected(self):
+        """目标文件已存在且不在本批重命名中时报错，原文件保持不变"""
+        self._create_files(["a.txt"])
+        with open(os.path.join(self.directory, "b.txt"), "w"):
+            pass
+        self.engine.files[0].new_name = "b.txt"
+        
+        success_count, error_count, _ = self.engine.execute_rename()
+        
+        self.assertEqual((success_count, error_count), (0, 1))
+        self.assertEqual(sorted(os.listdir(self.directory)), ["a.txt", "b.txt"])
+
+
+
+class LoadDirectoryTest(unittest.TestCase):
+    """load_directory / refresh_file_list 测试"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.engine = RenameEngine()
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _create_files(self, names):
+        for name in names:
+            with open(os.path.join(self.directory, name), "w"):
+                pass
+    
+    def test_extension_filter_matches_file_item_extension(self):
+        """扩展名筛选与文件项的扩展名规则一致，隐藏文件视为没有扩展名"""
+        self._create_files(["a.jpg", "b.JPG", ".jpg", "c.txt"])
+        
+        files = self.engine.load_directory(self.directory, file_filters=[".jpg"])
+        
+        self.assertEqual(sorted(f.original_name for f in files), ["a.jpg", "b.JPG"])
+        self.assertTrue(all(f.extension.lower() == ".jpg" for f in files))
+
+    
+    def test_refresh_after_relative_load(self):
+        """以相对路径加载的目录刷新后，现存文件不应被标记为错误"""
+        self._create_files(["a.txt", "b.txt"])
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        try:
+            self.engine.load_directory(".")
+            os.remove("b.txt")
+            self.engine.refresh_file_list()
+        finally:
+            os.chdir(cwd)
+        
+        statuses = {f.original_name: f.status for f in self.engine.files}
+        self.assertNotEqual(statuses["a.txt"], "error")
+        self.assertEqual(statuses["b.txt"], "error")
+
+
+if __name__ == "__main__":
+    unittest.main()
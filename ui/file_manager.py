@@ -7,12 +7,15 @@
 
 import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict
+from operator import attrgetter
 
 from ui.qt_adapter import (
-    Qt, QThread, Signal, QTimer, QIcon, QPixmap, QFont,
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    Qt, QThread, Signal, QTimer, QIcon, QPixmap, QFont, QColor,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QItemSelection, QItemSelectionModel,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QLabel, QLineEdit, QComboBox, QCheckBox, QGroupBox,
     QFileDialog, QHeaderView, QAbstractItemView, QSplitter, QFrame,
     QProgressBar, QMessageBox, QMenu, QAction
@@ -21,21 +24,284 @@ from ui.qt_adapter import (
 from core.rename_engine import RenameEngine, FileItem
 
 
-class EnhancedFileTableWidget(QTableWidget):
+# 状态图标
+_STATUS_ICONS = {
+    "ready": "●",
+    "renamed": "✓",
+    "error": "✗",
+    "skipped": "○",
+    "conflict": "⚠"
+}
+
+# 变更颜色：蓝色表示有变化
+_CHANGE_COLOR = QColor("#1976d2")
+
+# 行状态背景色
+_TRANSPARENT_BG = QColor(255, 255, 255, 0)
+_STATUS_BG = {
+    "ready": _TRANSPARENT_BG,               # 透明
+    "renamed": QColor(76, 175, 80, 30),     # 浅绿色
+    "error": QColor(244, 67, 54, 30),       # 浅红色
+    "skipped": QColor(255, 193, 7, 30),     # 浅黄色
+    "conflict": QColor(255, 152, 0, 30)     # 浅橙色
+}
+
+# 扩展名 -> 类型列文本，同一扩展名的所有行共享同一个字符串
+_TYPE_TEXTS: Dict[str, str] = {}
+
+# 文件大小单位
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 文件大小筛选区间（字节，闭区间）
+_MB = 1024 * 1024
+_SIZE_BOUNDS = {
+    "小于 1MB": (0, _MB - 1),
+    "1MB - 10MB": (_MB, 10 * _MB),
+    "10MB - 100MB": (10 * _MB, 100 * _MB),
+    "大于 100MB": (100 * _MB + 1, float('inf')),
+}
+
+# 修改时间筛选对应的天数，0 表示今天
+_TIME_FILTER_DAYS = {
+    "今天": 0,
+    "最近一周": 7,
+    "最近一月": 30,
+    "最近一年": 365,
+}
+
+
+class FileItemTableModel(QAbstractTableModel):
+    """文件列表数据模型 - 视图只按需查询可见单元格的数据"""
+    
+    HEADERS = ["状态", "原文件名", "新文件名", "类型", "大小", "修改时间", "路径"]
+    
+    # QFont/QIcon 需要在 QApplication 创建后构造，首次使用时再生成并共享
+    _bold_font = None
+    _folder_icon = None
+    _default_file_icon = None
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files: List[FileItem] = []
+        # 与 _files 平行的显示文本缓存（类型、大小、时间、路径），按需填充，
+        # 以路径对象身份和大小/时间/扩展名校验，重命名或刷新后自动失效
+        self._static_texts: List[Optional[tuple]] = []
+    
+    def set_files(self, files: List[FileItem]):
+        """替换全部文件数据"""
+        self.beginResetModel()
+        self._files = list(files)
+        self._static_texts = [None] * len(self._files)
+        self.endResetModel()
+    
+    def append_files(self, files: List[FileItem]):
+        """在末尾追加文件数据"""
+        if not files:
+            return
+        start = len(self._files)
+        self.beginInsertRows(QModelIndex(), start, start + len(files) - 1)
+        self._files.extend(files)
+        self._static_texts.extend([None] * len(files))
+        self.endInsertRows()
+    
+    def has_files(self, files: List[FileItem]) -> bool:
+        """判断模型是否已持有同一批文件项（同序）"""
+        return len(files) == len(self._files) and \
+            all(a is b for a, b in zip(files, self._files))
+    
+    def refresh_rows(self):
+        """文件项原地变化后通知视图重绘，未变化行的文本缓存继续复用"""
+        if self._files:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._files) - 1, len(self.HEADERS) - 1)
+            )
+    
+    def name_lower(self, row: int) -> str:
+        """获取指定行原文件名的小写形式"""
+        return self._files[row].original_name_lower
+    
+    def files_matching(self, name_filter: str) -> List[FileItem]:
+        """按模型顺序返回文件名包含筛选词的文件项"""
+        if not name_filter:
+            return list(self._files)
+        return [f for f in self._files if name_filter in f.original_name_lower]
+    
+    def file_at(self, row: int) -> Optional[FileItem]:
+        """获取指定行的文件项"""
+        if 0 <= row < len(self._files):
+            return self._files[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        file_item = self._files[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(index.row(), file_item, column)
+        
+        if role == Qt.ItemDataRole.UserRole:
+            return file_item
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (0, 3, 5):
+                return Qt.AlignmentFlag.AlignCenter
+            if column == 4:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return None
+        
+        if role == Qt.ItemDataRole.FontRole:
+            # 文件夹和有变化的新文件名加粗显示
+            if (column == 1 and file_item.is_directory) or \
+                    (column == 2 and file_item.new_name != file_item.original_name):
+                return self._get_bold_font()
+            return None
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 2 and file_item.new_name != file_item.original_name:
+                return _CHANGE_COLOR
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return _STATUS_BG.get(file_item.status, _TRANSPARENT_BG)
+        
+        if role == Qt.ItemDataRole.DecorationRole:
+            if column == 1:
+                if file_item.is_directory:
+                    return self._get_folder_icon()
+                return self._get_file_icon(file_item.extension)
+            return None
+        
+        return None
+    
+    def _display_text(self, row: int, file_item: FileItem, column: int) -> str:
+        """获取单元格显示文本"""
+        if column == 0:
+            return self._get_status_icon(file_item.status)
+        if column == 1:
+            return file_item.original_name
+        if column == 2:
+            return file_item.new_name
+        
+        cached = self._static_texts[row]
+        stamp = (file_item.size, file_item.modified_time, file_item.extension)
+        if cached is None or cached[0] is not file_item.original_path or cached[1] != stamp:
+            cached = (file_item.original_path, stamp, self._build_static_texts(file_item))
+            self._static_texts[row] = cached
+        return cached[2][column - 3]
+    
+    def _build_static_texts(self, file_item: FileItem) -> tuple:
+        """生成类型、大小、时间、路径列文本"""
+        if file_item.is_directory:
+            type_text, size_text = "文件夹", "-"
+        else:
+            extension = file_item.extension
+            type_text = _TYPE_TEXTS.get(extension)
+            if type_text is None:
+                type_text = _TYPE_TEXTS.setdefault(extension, extension.upper().lstrip('.'))
+            size_text = self._format_file_size(file_item.size)
+        return (
+            type_text,
+            size_text,
+            file_item.modified_date.strftime("%Y/%m/%d %H:%M"),
+            file_item.path_str,
+        )
+    
+    def _get_status_icon(self, status: str) -> str:
+        """获取状态图标"""
+        return _STATUS_ICONS.get(status, "●")
+    
+    @classmethod
+    def _get_bold_font(cls) -> QFont:
+        """获取共享的粗体字体"""
+        if cls._bold_font is None:
+            font = QFont()
+            font.setBold(True)
+            cls._bold_font = font
+        return cls._bold_font
+    
+    @classmethod
+    def _get_file_icon(cls, extension: str) -> QIcon:
+        """根据文件扩展名获取图标"""
+        # 可以根据扩展名返回不同的图标
+        if cls._default_file_icon is None:
+            cls._default_file_icon = QIcon()
+        return cls._default_file_icon
+    
+    @classmethod
+    def _get_folder_icon(cls) -> QIcon:
+        """获取文件夹图标"""
+        if cls._folder_icon is None:
+            cls._folder_icon = QIcon()
+        return cls._folder_icon
+    
+    @staticmethod
+    def _format_file_size(size_bytes: int) -> str:
+        """格式化文件大小"""
+        if size_bytes == 0:
+            return "0 B"
+        
+        # 每1024进一级，单位序号即二进制位数除以10
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
+
+
+class FileFilterProxyModel(QSortFilterProxyModel):
+    """文件筛选代理模型 - 负责排序和文件名筛选，输入筛选词时无需重新扫描目录"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_filter = ""
+    
+    def name_filter(self) -> str:
+        """当前文件名筛选词（小写）"""
+        return self._name_filter
+    
+    def set_name_filter(self, text: str) -> bool:
+        """设置文件名筛选词，筛选条件有变化时返回True"""
+        name_filter = text.strip().lower()
+        if name_filter == self._name_filter:
+            return False
+        self._name_filter = name_filter
+        self.invalidateFilter()
+        return True
+    
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        if not self._name_filter:
+            return True
+        return self._name_filter in self.sourceModel().name_lower(source_row)
+
+
+class EnhancedFileTableWidget(QTableView):
     """增强版文件表格组件 - 风格"""
     
     def __init__(self):
         super().__init__()
+        # 数据模型 + 排序代理，视图只渲染可见行
+        self.file_model = FileItemTableModel(self)
+        self.proxy_model = FileFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.file_model)
+        self.setModel(self.proxy_model)
+        
         self.setup_table()
         self.setup_context_menu()
         
     def setup_table(self):
         """设置表格"""
-        # 设置列
-        headers = ["状态", "原文件名", "新文件名", "类型", "大小", "修改时间", "路径"]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
-        
         # 设置表格属性
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -60,6 +326,11 @@ class EnhancedFileTableWidget(QTableWidget):
         # 设置行高
         self.verticalHeader().setDefaultSectionSize(36)
         self.verticalHeader().setVisible(False)
+    
+    def enable_fast_layout(self):
+        """启用固定行高和按像素滚动 - 所有行等高，滚动和调整大小时无需逐行计算行高"""
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
     def setup_context_menu(self):
         """设置右键菜单"""
@@ -68,7 +339,7 @@ class EnhancedFileTableWidget(QTableWidget):
         
     def show_context_menu(self, position):
         """显示右键菜单"""
-        if self.itemAt(position) is None:
+        if not self.indexAt(position).isValid():
             return
             
         menu = QMenu(self)
@@ -92,152 +363,60 @@ class EnhancedFileTableWidget(QTableWidget):
         
         menu.exec(self.mapToGlobal(position))
     
+    def current_file_item(self) -> Optional[FileItem]:
+        """获取当前行对应的文件项"""
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return self.file_model.file_at(self.proxy_model.mapToSource(index).row())
+    
     def copy_filename(self):
         """复制文件名到剪贴板"""
-        current_row = self.currentRow()
-        if current_row >= 0:
-            filename = self.item(current_row, 1).text()
-            from ui.qt_adapter import QApplication
-            QApplication.clipboard().setText(filename)
+        file_item = self.current_file_item()
+        if file_item:
+            QApplication.clipboard().setText(file_item.original_name)
     
     def copy_filepath(self):
         """复制完整路径到剪贴板"""
-        current_row = self.currentRow()
-        if current_row >= 0:
-            path = self.item(current_row, 6).text()
-            from ui.qt_adapter import QApplication
-            QApplication.clipboard().setText(path)
+        file_item = self.current_file_item()
+        if file_item:
+            QApplication.clipboard().setText(file_item.path_str)
     
     def show_in_explorer(self):
         """在资源管理器中显示文件"""
-        current_row = self.currentRow()
-        if current_row >= 0:
-            path = self.item(current_row, 6).text()
-            os.startfile(os.path.dirname(path))
+        file_item = self.current_file_item()
+        if file_item:
+            os.startfile(os.path.dirname(file_item.path_str))
     
     def load_files(self, files: List[FileItem]):
         """加载文件到表格"""
-        self.setRowCount(len(files))
-        
-        for row, file_item in enumerate(files):
-            # 状态图标
-            status_item = QTableWidgetItem()
-            status_item.setData(Qt.ItemDataRole.UserRole, file_item)
-            status_item.setText(self._get_status_icon(file_item.status))
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 0, status_item)
-            
-            # 原文件名
-            original_item = QTableWidgetItem(file_item.original_name)
-            if file_item.is_directory:
-                font = QFont()
-                font.setBold(True)
-                original_item.setFont(font)
-                original_item.setIcon(self._get_folder_icon())
-            else:
-                original_item.setIcon(self._get_file_icon(file_item.extension))
-            self.setItem(row, 1, original_item)
-            
-            # 新文件名
-            new_name_item = QTableWidgetItem(file_item.new_name)
-            if file_item.new_name != file_item.original_name:
-                font = QFont()
-                font.setBold(True)
-                new_name_item.setFont(font)
-                # 设置颜色表示有变化
-                new_name_item.setForeground(self._get_change_color())
-            self.setItem(row, 2, new_name_item)
-            
-            # 文件类型
-            file_type = "文件夹" if file_item.is_directory else file_item.extension.upper().lstrip('.')
-            type_item = QTableWidgetItem(file_type)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 3, type_item)
-            
-            # 文件大小
-            size_text = self._format_file_size(file_item.size) if not file_item.is_directory else "-"
-            size_item = QTableWidgetItem(size_text)
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.setItem(row, 4, size_item)
-            
-            # 修改时间
-            time_text = file_item.modified_date.strftime("%Y/%m/%d %H:%M")
-            time_item = QTableWidgetItem(time_text)
-            time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 5, time_item)
-            
-            # 文件路径
-            path_item = QTableWidgetItem(str(file_item.original_path))
-            self.setItem(row, 6, path_item)
-            
-            # 设置状态背景色
-            self._set_row_status_color(row, file_item.status)
-    
-    def _get_status_icon(self, status: str) -> str:
-        """获取状态图标"""
-        status_icons = {
-            "ready": "●",
-            "renamed": "✓",
-            "error": "✗",
-            "skipped": "○",
-            "conflict": "⚠"
-        }
-        return status_icons.get(status, "●")
-    
-    def _get_change_color(self):
-        """获取变更颜色"""
-        from ui.qt_adapter import QColor
-        return QColor("#1976d2")  # 蓝色表示有变化
-    
-    def _set_row_status_color(self, row: int, status: str):
-        """设置行状态背景色"""
-        from ui.qt_adapter import QColor
-        
-        color_map = {
-            "ready": QColor(255, 255, 255, 0),      # 透明
-            "renamed": QColor(76, 175, 80, 30),     # 浅绿色
-            "error": QColor(244, 67, 54, 30),       # 浅红色
-            "skipped": QColor(255, 193, 7, 30),     # 浅黄色
-            "conflict": QColor(255, 152, 0, 30)     # 浅橙色
-        }
-        
-        color = color_map.get(status, QColor(255, 255, 255, 0))
-        
-        for col in range(self.columnCount()):
-            item = self.item(row, col)
-            if item:
-                item.setBackground(color)
+        self.file_model.set_files(files)
     
-    def _get_file_icon(self, extension: str) -> QIcon:
-        """根据文件扩展名获取图标"""
-        # 可以根据扩展名返回不同的图标
-        return QIcon()
-    
-    def _get_folder_icon(self) -> QIcon:
-        """获取文件夹图标"""
-        return QIcon()
-    
-    def _format_file_size(self, size_bytes: int) -> str:
-        """格式化文件大小"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
+    def rowCount(self) -> int:
+        """当前显示的行数"""
+        return self.proxy_model.rowCount()
 
 
 class EnhancedFileFilterWidget(QWidget):
     """增强版文件筛选器 - 更多筛选选项"""
     
     filter_changed = Signal()
+    name_filter_changed = Signal(str)
     
     def __init__(self):
         super().__init__()
+        # 文件名筛选只在内存中过滤，停止输入150ms后再应用
+        self._name_debounce = QTimer(self)
+        self._name_debounce.setSingleShot(True)
+        self._name_debounce.setInterval(150)
+        self._name_debounce.timeout.connect(
+            lambda: self.name_filter_changed.emit(self.name_edit.text())
+        )
+        # 其它筛选项需要重新扫描目录，合并200ms内的连续变更只触发一次
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(200)
+        self._debounce.timeout.connect(self.filter_changed.emit)
         self.setup_ui()
         
     def setup_ui(self):
@@ -261,18 +440,18 @@ class EnhancedFileFilterWidget(QWidget):
             "可执行文件 (*.exe;*.msi;*.bat)",
             "自定义..."
         ])
-        self.type_combo.currentTextChanged.connect(self.filter_changed.emit)
+        self.type_combo.currentTextChanged.connect(self._schedule_filter_changed)
         
         # 包含选项
         self.include_subdirs_cb = QCheckBox("包含子目录")
-        self.include_subdirs_cb.toggled.connect(self.filter_changed.emit)
+        self.include_subdirs_cb.toggled.connect(self._schedule_filter_changed)
         
         self.show_hidden_cb = QCheckBox("显示隐藏文件")
-        self.show_hidden_cb.toggled.connect(self.filter_changed.emit)
+        self.show_hidden_cb.toggled.connect(self._schedule_filter_changed)
         
         self.include_folders_cb = QCheckBox("包含文件夹")
         self.include_folders_cb.setChecked(True)
-        self.include_folders_cb.toggled.connect(self.filter_changed.emit)
+        self.include_folders_cb.toggled.connect(self._schedule_filter_changed)
         
         basic_layout.addWidget(self.type_label)
         basic_layout.addWidget(self.type_combo)
@@ -294,7 +473,7 @@ class EnhancedFileFilterWidget(QWidget):
             "10MB - 100MB",
             "大于 100MB"
         ])
-        self.size_combo.currentTextChanged.connect(self.filter_changed.emit)
+        self.size_combo.currentTextChanged.connect(self._schedule_filter_changed)
         
         # 修改时间筛选
         self.time_label = QLabel("修改时间:")
@@ -306,13 +485,13 @@ class EnhancedFileFilterWidget(QWidget):
             "最近一月",
             "最近一年"
         ])
-        self.time_combo.currentTextChanged.connect(self.filter_changed.emit)
+        self.time_combo.currentTextChanged.connect(self._schedule_filter_changed)
         
         # 文件名筛选
         self.name_label = QLabel("文件名包含:")
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("输入要筛选的文件名关键词...")
-        self.name_edit.textChanged.connect(self.filter_changed.emit)
+        self.name_edit.textChanged.connect(self._schedule_name_filter_changed)
         
         advanced_layout.addWidget(self.size_label)
         advanced_layout.addWidget(self.size_combo)
@@ -325,6 +504,14 @@ class EnhancedFileFilterWidget(QWidget):
         layout.addLayout(basic_layout)
         layout.addLayout(advanced_layout)
     
+    def _schedule_filter_changed(self, *args):
+        """筛选项变更后重新计时（信号参数不传给QTimer.start，避免被当作毫秒数）"""
+        self._debounce.start()
+    
+    def _schedule_name_filter_changed(self, *args):
+        """文件名输入变更后重新计时"""
+        self._name_debounce.start()
+    
     def get_file_filters(self) -> List[str]:
         """获取当前文件筛选器"""
         current_text = self.type_combo.currentText()
@@ -359,17 +546,114 @@ class EnhancedFileFilterWidget(QWidget):
         }
 
 
+class DirectoryLoadWorker(QThread):
+    """目录加载线程 - 扫描目录和筛选都在后台完成，避免阻塞界面"""
+    
+    # 每批发送给界面的文件数
+    BATCH_SIZE = 500
+    
+    batch_ready = Signal(list)
+    files_ready = Signal(list)
+    error = Signal(str)
+    
+    def __init__(self, engine: RenameEngine, directory: str, options: Dict, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.directory = directory
+        self.options = options
+    
+    def run(self):
+        """执行加载 - 边扫描边分批发送，结束后再发送按名称排序的完整列表"""
+        try:
+            options = self.options
+            files = []
+            batch = []
+            
+            for file_item in self.engine.iter_directory(
+                self.directory,
+                options['include_subdirs'],
+                options['file_types']
+            ):
+                if self.isInterruptionRequested():
+                    return
+                
+                batch.append(file_item)
+                if len(batch) >= self.BATCH_SIZE:
+                    self._emit_batch(batch, files)
+                    batch = []
+            
+            if batch:
+                self._emit_batch(batch, files)
+            if self.isInterruptionRequested():
+                return
+            
+            files.sort(key=attrgetter('_sort_key'))
+            self.files_ready.emit(files)
+            
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def _emit_batch(self, batch: List[FileItem], files: List[FileItem]):
+        """对一批文件应用其他筛选器并发送"""
+        batch = self.apply_additional_filters(batch, self.options)
+        if batch:
+            files.extend(batch)
+            self.batch_ready.emit(batch)
+    
+    def apply_additional_filters(self, files: List[FileItem], options: Dict) -> List[FileItem]:
+        """应用额外的筛选器 - 每个生效的筛选条件对整列做一次推导，未启用的直接跳过"""
+        # 文件夹筛选
+        if not options['include_folders']:
+            files = [f for f in files if not f.is_directory]
+        
+        # 隐藏文件筛选
+        if not options['show_hidden']:
+            files = [f for f in files if not f.original_name.startswith('.')]
+        
+        # 文件大小筛选（文件夹不参与）
+        size_bounds = _SIZE_BOUNDS.get(options['size_filter'])
+        if size_bounds:
+            min_size, max_size = size_bounds
+            files = [f for f in files if f.is_directory or min_size <= f.size <= max_size]
+        
+        # 时间筛选
+        time_range = self._get_time_range(options['time_filter'])
+        if time_range:
+            start, end = time_range
+            files = [f for f in files if start <= f.modified_time < end]
+        
+        return files
+    
+    def _get_time_range(self, time_filter: str) -> Optional[tuple]:
+        """把时间筛选项换算成修改时间戳区间 [start, end)，不限制时返回None"""
+        days = _TIME_FILTER_DAYS.get(time_filter)
+        if days is None:
+            return None
+        
+        now = datetime.now()
+        if days == 0:
+            # 今天：本地时间当天零点到次日零点
+            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            return today.timestamp(), (today + timedelta(days=1)).timestamp()
+        return (now - timedelta(days=days)).timestamp(), float('inf')
+
+
 class EnhancedFileManagerWidget(QWidget):
     """增强版文件管理器主组件"""
     
     files_loaded = Signal(list)
     selection_changed = Signal(list)
+    files_about_to_reset = Signal()  # 即将在主线程中重置已加载文件项的预览结果
+    loading_started = Signal()       # 开始扫描新目录，之前发出的文件列表已作废
     
     def __init__(self):
         super().__init__()
         self.current_directory = None
-        self.files = []
+        self.files = []           # 当前可见（通过文件名筛选）的文件
+        self._all_files = []      # 最近一次扫描得到的全部文件
         self.load_thread = None
+        # 扫描用引擎常驻复用，由加载线程共享（iter_directory不修改引擎状态）
+        self._engine = RenameEngine()
         self.setup_ui()
         
     def setup_ui(self):
@@ -417,6 +701,7 @@ class EnhancedFileManagerWidget(QWidget):
         # 筛选器
         self.filter_widget = EnhancedFileFilterWidget()
         self.filter_widget.filter_changed.connect(self.refresh_files)
+        self.filter_widget.name_filter_changed.connect(self.apply_name_filter)
         
         # 文件列表区域
         list_group = QGroupBox("文件列表")
@@ -452,7 +737,12 @@ class EnhancedFileManagerWidget(QWidget):
         
         # 文件表格
         self.file_table = EnhancedFileTableWidget()
-        self.file_table.itemSelectionChanged.connect(self.on_selection_changed)
+        # 连续拖选/Shift点选时合并选择变更，停止后再统一通知
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self.on_selection_changed)
+        self.file_table.selectionModel().selectionChanged.connect(self._schedule_selection_changed)
         
         list_layout.addLayout(stats_layout)
         list_layout.addWidget(self.progress_bar)
@@ -466,7 +756,6 @@ class EnhancedFileManagerWidget(QWidget):
     def load_quick_path(self, folder_name: str):
         """加载快捷路径"""
         try:
-            from pathlib import Path
             if folder_name == "Desktop":
                 path = Path.home() / "Desktop"
             elif folder_name == "Documents":
@@ -503,103 +792,68 @@ class EnhancedFileManagerWidget(QWidget):
         self.invert_selection_btn.setEnabled(True)
         
         # 开始加载文件
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
-        
-        # 这里应该创建加载线程，简化版本直接加载
-        self.load_files_sync()
+        self.start_loading()
     
-    def load_files_sync(self):
-        """同步加载文件（简化版本）"""
-        try:
-            engine = RenameEngine()
-            filter_options = self.filter_widget.get_filter_options()
-            
-            files = engine.load_directory(
-                str(self.current_directory),
-                filter_options['include_subdirs'],
-                filter_options['file_types']
-            )
-            
-            # 应用其他筛选器
-            filtered_files = self.apply_additional_filters(files, filter_options)
-            
-            self.on_files_loaded(filtered_files)
-            
-        except Exception as e:
-            self.on_load_error(str(e))
-    
-    def apply_additional_filters(self, files: List[FileItem], options: Dict) -> List[FileItem]:
-        """应用额外的筛选器"""
-        filtered_files = []
+    def start_loading(self):
+        """在后台线程中扫描目录并应用筛选器"""
+        if self.load_thread is not None:
+            # 丢弃仍在进行的旧扫描，其结果到达时会被忽略
+            self.load_thread.requestInterruption()
         
-        for file_item in files:
-            # 文件夹筛选
-            if file_item.is_directory and not options['include_folders']:
-                continue
-                
-            # 隐藏文件筛选
-            if file_item.original_name.startswith('.') and not options['show_hidden']:
-                continue
-                
-            # 文件名筛选
-            if options['name_filter'] and options['name_filter'].lower() not in file_item.original_name.lower():
-                continue
-                
-            # 文件大小筛选
-            if not self.check_size_filter(file_item, options['size_filter']):
-                continue
-                
-            # 时间筛选
-            if not self.check_time_filter(file_item, options['time_filter']):
-                continue
-                
-            filtered_files.append(file_item)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
         
-        return filtered_files
-    
-    def check_size_filter(self, file_item: FileItem, size_filter: str) -> bool:
-        """检查文件大小筛选"""
-        if size_filter == "不限制" or file_item.is_directory:
-            return True
-            
-        size_mb = file_item.size / (1024 * 1024)
-        
-        if size_filter == "小于 1MB":
-            return size_mb < 1
-        elif size_filter == "1MB - 10MB":
-            return 1 <= size_mb <= 10
-        elif size_filter == "10MB - 100MB":
-            return 10 <= size_mb <= 100
-        elif size_filter == "大于 100MB":
-            return size_mb > 100
-            
-        return True
-    
-    def check_time_filter(self, file_item: FileItem, time_filter: str) -> bool:
-        """检查时间筛选"""
-        if time_filter == "不限制":
-            return True
-            
-        from datetime import datetime, timedelta
-        now = datetime.now()
-        file_time = file_item.modified_date
-        
-        if time_filter == "今天":
-            return file_time.date() == now.date()
-        elif time_filter == "最近一周":
-            return file_time >= now - timedelta(days=7)
-        elif time_filter == "最近一月":
-            return file_time >= now - timedelta(days=30)
-        elif time_filter == "最近一年":
-            return file_time >= now - timedelta(days=365)
-            
-        return True
+        # 清空表格，扫描结果分批追加显示
+        self._all_files = []
+        self.files = []
+        self.file_table.load_files([])
+        self.loading_started.emit()
+        
+        worker = DirectoryLoadWorker(
+            self._engine,
+            str(self.current_directory),
+            self.filter_widget.get_filter_options(),
+            self
+        )
+        worker.batch_ready.connect(self._on_worker_batch_ready)
+        worker.files_ready.connect(self._on_worker_files_ready)
+        worker.error.connect(self._on_worker_error)
+        worker.finished.connect(self._on_worker_finished)
+        self.load_thread = worker
+        worker.start()
+    
+    def _on_worker_batch_ready(self, batch: List[FileItem]):
+        """加载线程送来一批文件，追加到表格"""
+        if self.sender() is self.load_thread:
+            self.file_table.file_model.append_files(batch)
+            self.stats_label.setText(f"正在加载... 已找到 {self.file_table.file_model.rowCount()} 项")
+    
+    def _on_worker_files_ready(self, files: List[FileItem]):
+        """加载线程完成"""
+        if self.sender() is self.load_thread:
+            self.on_files_loaded(files)
+    
+    def _on_worker_error(self, error_message: str):
+        """加载线程出错"""
+        if self.sender() is self.load_thread:
+            self.on_load_error(error_message)
+    
+    def _on_worker_finished(self):
+        """加载线程退出后释放"""
+        worker = self.sender()
+        if worker is self.load_thread:
+            self.load_thread = None
+        if worker is not None:
+            worker.deleteLater()
+    
+    def enable_fast_layout(self):
+        """启用文件表格的快速布局（固定行高）"""
+        self.file_table.enable_fast_layout()
     
     def refresh_files(self):
         """刷新文件列表"""
         if self.current_directory:
-            self.load_files_sync()
+            self.start_loading()
     
     def select_all_files(self):
         """全选文件"""
@@ -610,26 +864,56 @@ class EnhancedFileManagerWidget(QWidget):
         self.file_table.clearSelection()
     
     def invert_selection(self):
-        """反选"""
-        selection_model = self.file_table.selectionModel()
-        for row in range(self.file_table.rowCount()):
-            index = self.file_table.model().index(row, 0)
-            if selection_model.isRowSelected(row, index.parent()):
-                selection_model.select(index, selection_model.SelectionFlag.Deselect | selection_model.SelectionFlag.Rows)
-            else:
-                selection_model.select(index, selection_model.SelectionFlag.Select | selection_model.SelectionFlag.Rows)
+        """反选 - 对所有行做一次整体切换，只触发一次选择变更"""
+        model = self.file_table.model()
+        row_count = model.rowCount()
+        if row_count == 0:
+            return
+        
+        selection = QItemSelection(
+            model.index(0, 0),
+            model.index(row_count - 1, model.columnCount() - 1)
+        )
+        self.file_table.selectionModel().select(
+            selection,
+            QItemSelectionModel.SelectionFlag.Toggle | QItemSelectionModel.SelectionFlag.Rows
+        )
     
     def on_files_loaded(self, files: List[FileItem]):
         """文件加载完成处理"""
         self.progress_bar.setVisible(False)
-        self.files = files
+        self._all_files = files
         
         # 更新表格
         self.file_table.load_files(files)
+        self._publish_visible_files()
+    
+    def apply_name_filter(self, text: str):
+        """应用文件名筛选 - 通过代理模型过滤已加载的文件，不重新扫描目录"""
+        if not self.file_table.proxy_model.set_name_filter(text):
+            return
+        if not self._all_files:
+            return
+        
+        # 可见文件集合改变相当于重新加载：清除之前的预览结果。
+        # 先通知接收方停止仍在写入这些文件项的后台预览，避免旧结果覆盖重置后的文件名
+        self.files_about_to_reset.emit()
+        for file_item in self._all_files:
+            file_item.new_name = file_item.original_name
+            file_item.status = "ready"
+        self.file_table.file_model.refresh_rows()
+        self._publish_visible_files()
+    
+    def _publish_visible_files(self):
+        """更新统计信息并发出当前可见文件列表"""
+        files = self.file_table.file_model.files_matching(
+            self.file_table.proxy_model.name_filter()
+        )
+        self.files = files
         
         # 更新统计信息
-        total_files = len([f for f in files if not f.is_directory])
-        total_dirs = len([f for f in files if f.is_directory])
+        total_dirs = sum(map(attrgetter('is_directory'), files))
+        total_files = len(files) - total_dirs
         
         if total_dirs > 0:
             self.stats_label.setText(f"共 {len(files)} 项 ({total_files} 个文件, {total_dirs} 个文件夹)")
@@ -644,30 +928,29 @@ class EnhancedFileManagerWidget(QWidget):
         self.progress_bar.setVisible(False)
         QMessageBox.warning(self, "加载错误", f"加载文件时发生错误:\n{error_message}")
     
+    def _schedule_selection_changed(self, *args):
+        """选择变更后重新计时"""
+        self._selection_timer.start()
+    
     def on_selection_changed(self):
         """选择变更处理"""
-        selected_rows = set()
-        for item in self.file_table.selectedItems():
-            selected_rows.add(item.row())
-        
-        selected_files = []
-        for row in selected_rows:
-            item = self.file_table.item(row, 0)
-            if item:
-                file_item = item.data(Qt.ItemDataRole.UserRole)
-                if file_item:
-                    selected_files.append(file_item)
-        
-        self.selection_changed.emit(selected_files)
+        self.selection_changed.emit(self.get_selected_files())
     
     def update_preview(self, files: List[FileItem]):
         """更新预览"""
-        self.files = files
-        self.file_table.load_files(files)
+        if files is not self.files:
+            # 外部传入的新列表，作为完整文件集显示
+            self.files = files
+            self._all_files = files
+        self.refresh_preview()
         
         # 更新统计信息
-        will_rename = sum(1 for f in files if f.new_name != f.original_name and f.status != "conflict")
-        conflicts = sum(1 for f in files if f.status == "conflict")
+        will_rename = conflicts = 0
+        for f in files:
+            if f.status == "conflict":
+                conflicts += 1
+            elif f.new_name != f.original_name:
+                will_rename += 1
         
         status_text = f"共 {len(files)} 项"
         if will_rename > 0:
@@ -683,15 +966,19 @@ class EnhancedFileManagerWidget(QWidget):
     
     def get_selected_files(self) -> List[FileItem]:
         """获取选中的文件列表"""
-        selected_files = []
-        for item in self.file_table.selectedItems():
-            if item.column() == 0:
-                file_item = item.data(Qt.ItemDataRole.UserRole)
-                if file_item:
-                    selected_files.append(file_item)
-        return selected_files
+        # 每个选中行只取一个索引，映射回源模型后直接取文件项
+        proxy = self.file_table.proxy_model
+        file_at = self.file_table.file_model.file_at
+        return [
+            file_at(proxy.mapToSource(index).row())
+            for index in self.file_table.selectionModel().selectedRows(0)
+        ]
     
     def refresh_preview(self):
         """刷新预览"""
-        if self.files:
-            self.file_table.load_files(self.files)
+        model = self.file_table.file_model
+        if model.has_files(self._all_files):
+            # 同一批文件只是新文件名/状态变化，无需重建
+            model.refresh_rows()
+        else:
+            self.file_table.load_files(self._all_files)
@@ -5,23 +5,24 @@
 提供更丰富的功能和更好的用户体验
 """
 
-import sys
-from pathlib import Path
-from typing import List
+from copy import copy
+from typing import TYPE_CHECKING, List, Optional
 
 from ui.qt_adapter import (
-    Qt, QTimer, Signal, QIcon, QAction, QFont, QPixmap,
+    Qt, QTimer, Signal, QObject, QThreadPool, QRunnable, QAction,
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QMenuBar, QToolBar, QStatusBar, QPushButton, QLabel, QMessageBox,
+    QLabel, QMessageBox,
     QProgressDialog, QDialog, QDialogButtonBox, QTextEdit, QGroupBox,
-    QApplication, QTabWidget, QFrame
+    QApplication, QTabWidget, QListView, QTextDocument,
+    QAbstractListModel, QModelIndex
 )
 
-from core.rename_engine import RenameEngine, FileItem
-from ui.file_manager import EnhancedFileManagerWidget
-from ui.rule_panels import RulePanelsWidget, ClearFilenamePanel
 from ui.themes import get_enhanced_theme_manager, ThemeMode
 
+# 引擎、文件管理器和规则面板在主窗口创建时才导入，模块本身只依赖Qt和主题
+if TYPE_CHECKING:
+    from core.rename_engine import RenameEngine, FileItem
+
 
 class WelcomeWidget(QWidget):
     """欢迎界面组件"""
@@ -38,36 +39,24 @@ class WelcomeWidget(QWidget):
         # 标题
         title_label = QLabel("🚀 批量文件重命名工具")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #1976d2; margin: 20px;")
+        title_label.setObjectName("welcomeTitle")
         
         # 副标题
         subtitle_label = QLabel("我很会养猪丶开发版-功能更强大")
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(14)
-        subtitle_label.setFont(subtitle_font)
-        subtitle_label.setStyleSheet("color: #666; margin: 20px;")
+        subtitle_label.setObjectName("welcomeSubtitle")
         
         # 功能介绍
         features_label = QLabel("""
         9种重命名模式，实时预览效果，支持一键撤销，支持大量文件的快速处理
         """)
-        subtitle_font.setPointSize(8)
         features_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        features_label.setStyleSheet("color: #424242; line-height: 1.8; margin: 20px;")
+        features_label.setObjectName("welcomeFeatures")
         
         # 开始使用提示
         start_label = QLabel("点击左上角的\"主工作区\"按钮开始使用")
         start_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        start_font = QFont()
-        start_font.setPointSize(12)
-        start_font.setBold(True)
-        start_label.setFont(start_font)
-        start_label.setStyleSheet("color: #1976d2; margin: 20px;")
+        start_label.setObjectName("welcomeStart")
         
         layout.addWidget(title_label)
         layout.addWidget(subtitle_label)
@@ -75,6 +64,83 @@ class WelcomeWidget(QWidget):
         layout.addWidget(start_label)
 
 
+# 预览列表中的状态图标，未列出的状态显示为 ✅
+_PREVIEW_STATUS_ICONS = {
+    "conflict": "⚠️",
+}
+
+
+class RenamePreviewModel(QAbstractListModel):
+    """重命名预览列表模型 - 只包含名称有变化的文件，显示文本在视图需要时才生成"""
+    
+    def __init__(self, files: List["FileItem"], parent=None):
+        super().__init__(parent)
+        self._files = [f for f in files if f.new_name != f.original_name]
+        # 显示文本缓存：对话框打开期间文件项不会变化，每行只格式化一次
+        self._texts: List[Optional[str]] = [None] * len(self._files)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        row = index.row()
+        text = self._texts[row]
+        if text is None:
+            file_item = self._files[row]
+            status_icon = _PREVIEW_STATUS_ICONS.get(file_item.status, "✅")
+            text = self._texts[row] = f"{status_icon} {file_item.original_name} → {file_item.new_name}"
+        return text
+
+
+class PreviewSignals(QObject):
+    """预览任务信号 - 在主线程中创建，跨线程发射时自动排队到主线程"""
+    
+    preview_ready = Signal(int, object, object)   # 请求编号, (新文件名, 状态)列表, 预览摘要
+    preview_failed = Signal(int, str)             # 请求编号, 错误信息
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 最近一次完成但尚未应用的预览结果，主线程等待任务结束后可直接取用
+        self.last_result = None
+
+
+class PreviewWorker(QRunnable):
+    """预览计算任务 - 在线程池中套用规则，避免规则编辑时阻塞界面"""
+    
+    def __init__(self, engine: "RenameEngine", files: List["FileItem"], rules: list,
+                 request_id: int, signals: PreviewSignals):
+        super().__init__()
+        self.engine = engine
+        self.files = files
+        self.rules = rules
+        self.request_id = request_id
+        self.signals = signals
+    
+    def run(self):
+        """执行预览"""
+        engine = self.engine
+        try:
+            # 在文件项副本上计算，主线程绘制表格时读取的文件项不会被后台改写
+            engine.files = [copy(file_item) for file_item in self.files]
+            engine.clear_rules()
+            for rule in self.rules:
+                engine.add_rule(rule)
+            engine.preview_rename()
+            results = [(file_item.new_name, file_item.status) for file_item in engine.files]
+            summary = engine.get_rename_preview_summary()
+        except Exception as e:
+            self.signals.preview_failed.emit(self.request_id, str(e))
+            return
+        finally:
+            engine.files = []
+        
+        self.signals.last_result = (self.request_id, results, summary)
+        self.signals.preview_ready.emit(self.request_id, results, summary)
+
+
 class EnhancedPreviewDialog(QDialog):
     """增强版预览对话框"""
     
@@ -109,14 +175,12 @@ class EnhancedPreviewDialog(QDialog):
         """
         
         summary_label = QLabel(summary_text)
-        summary_font = QFont()
-        summary_font.setPointSize(12)
-        summary_label.setFont(summary_font)
+        summary_label.setObjectName("previewSummary")
         summary_layout.addWidget(summary_label)
         
         if conflicts > 0:
             warning_label = QLabel("⚠️ 检测到名称冲突，冲突的文件将被跳过")
-            warning_label.setStyleSheet("color: #ff9800; font-weight: bold; font-size: 14px;")
+            warning_label.setObjectName("previewWarning")
             summary_layout.addWidget(warning_label)
         
         layout.addWidget(summary_group)
@@ -126,21 +190,15 @@ class EnhancedPreviewDialog(QDialog):
             preview_group = QGroupBox("详细预览")
             preview_layout = QVBoxLayout(preview_group)
             
-            preview_text = QTextEdit()
-            preview_text.setReadOnly(True)
-            preview_text.setMaximumHeight(200)
-            
-            preview_content = ""
-            for file_item in self.files[:50]:  # 只显示前50个
-                if file_item.new_name != file_item.original_name:
-                    status_icon = "⚠️" if file_item.status == "conflict" else "✅"
-                    preview_content += f"{status_icon} {file_item.original_name} → {file_item.new_name}\n"
-            
-            if len(self.files) > 50:
-                preview_content += f"\n... 还有 {len(self.files) - 50} 个文件"
+            # 列表视图只为可见行创建显示内容，可完整显示所有变更
+            preview_view = QListView()
+            preview_view.setModel(RenamePreviewModel(self.files, preview_view))
+            preview_view.setUniformItemSizes(True)
+            preview_view.setLayoutMode(QListView.LayoutMode.Batched)
+            preview_view.setBatchSize(100)
+            preview_view.setMaximumHeight(200)
             
-            preview_text.setText(preview_content)
-            preview_layout.addWidget(preview_text)
+            preview_layout.addWidget(preview_view)
             layout.addWidget(preview_group)
         
         # 按钮
@@ -150,7 +208,7 @@ class EnhancedPreviewDialog(QDialog):
         
         ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
         ok_button.setText("执行重命名")
-        ok_button.setStyleSheet("font-weight: bold; font-size: 14px;")
+        ok_button.setObjectName("previewExecuteButton")
         
         cancel_button = button_box.button(QDialogButtonBox.StandardButton.Cancel)
         cancel_button.setText("取消")
@@ -164,6 +222,9 @@ class EnhancedPreviewDialog(QDialog):
 class EnhancedAboutDialog(QDialog):
     """增强版关于对话框"""
     
+    # 关于信息内容固定不变，HTML只解析一次，之后的实例共享同一文档
+    _about_document = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
@@ -181,14 +242,14 @@ class EnhancedAboutDialog(QDialog):
         
         # 这里可以添加应用图标
         icon_label = QLabel("🚀")
-        icon_label.setStyleSheet("font-size: 48px;")
+        icon_label.setObjectName("aboutIcon")
         
         title_layout = QVBoxLayout()
         app_label = QLabel("批量文件重命名工具")
-        app_label.setFont(QFont("", 18, QFont.Weight.Bold))
+        app_label.setObjectName("aboutTitle")
         
         version_label = QLabel("版本 1.0.0 (我很会养猪丶开发版)")
-        version_label.setStyleSheet("color: #666;")
+        version_label.setObjectName("aboutVersion")
         
         title_layout.addWidget(app_label)
         title_layout.addWidget(version_label)
@@ -200,7 +261,22 @@ class EnhancedAboutDialog(QDialog):
         # 详细信息
         info_text = QTextEdit()
         info_text.setReadOnly(True)
-        info_text.setHtml("""
+        info_text.setDocument(self._get_about_document())
+        
+        # 按钮
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+        button_box.accepted.connect(self.accept)
+        
+        layout.addLayout(header_layout)
+        layout.addWidget(info_text)
+        layout.addWidget(button_box)
+    
+    @classmethod
+    def _get_about_document(cls) -> QTextDocument:
+        """获取共享的关于信息文档"""
+        if cls._about_document is None:
+            document = QTextDocument()
+            document.setHtml("""
         <div style="font-family: 'Microsoft YaHei UI'; line-height: 1.6;">
         <h3 style="color: #1976d2;">产品特性</h3>
         <ul>
@@ -229,14 +305,8 @@ class EnhancedAboutDialog(QDialog):
         </p>
         </div>
         """)
-        
-        # 按钮
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
-        button_box.accepted.connect(self.accept)
-        
-        layout.addLayout(header_layout)
-        layout.addWidget(info_text)
-        layout.addWidget(button_box)
+            cls._about_document = document
+        return cls._about_document
 
 
 class EnhancedMainWindow(QMainWindow):
@@ -244,8 +314,38 @@ class EnhancedMainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        from core.rename_engine import RenameEngine
+        
         self.rename_engine = RenameEngine()
         self.current_files = []
+        self._about_dialog = None  # 关于对话框首次打开时创建，之后复用
+        self._progress = None      # 重命名进度对话框，同上
+        self._confirm_box = None   # 确认对话框，同上
+        
+        # 预览在单线程池中串行计算，使用独立的引擎实例；
+        # 请求编号用于丢弃已过期的预览结果
+        self._preview_engine = RenameEngine()
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_request = 0
+        self._last_preview_hash = None  # 上次推送到文件列表的预览结果摘要
+        self._preview_signals = PreviewSignals(self)
+        self._preview_signals.preview_ready.connect(self._apply_preview)
+        self._preview_signals.preview_failed.connect(self._on_preview_failed)
+        
+        # 连续编辑规则时合并变更，停止输入150ms后才计算预览
+        self._rules_timer = QTimer(self)
+        self._rules_timer.setSingleShot(True)
+        self._rules_timer.setInterval(150)
+        self._rules_timer.timeout.connect(self._do_rules_changed)
+        
+        # 状态文本合并刷新：短时间内多次更新只显示最后一条，最多约60次/秒重绘
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+        
         self.setup_ui()
         self.setup_connections()
         
@@ -397,6 +497,9 @@ class EnhancedMainWindow(QMainWindow):
     
     def create_central_widget(self):
         """创建中央组件"""
+        from ui.file_manager import EnhancedFileManagerWidget
+        from ui.rule_panels import RulePanelsWidget, ClearFilenamePanel
+        
         # 创建标签页容器
         self.tab_widget = QTabWidget()
         
@@ -410,6 +513,7 @@ class EnhancedMainWindow(QMainWindow):
         
         # 左侧：文件管理器
         self.file_manager = EnhancedFileManagerWidget()
+        self.file_manager.enable_fast_layout()
         self.file_manager.setMinimumWidth(700)
         
         # 右侧：规则面板标签页
@@ -472,6 +576,8 @@ class EnhancedMainWindow(QMainWindow):
         # 文件管理器信号
         self.file_manager.files_loaded.connect(self.on_files_loaded)
         self.file_manager.selection_changed.connect(self.on_selection_changed)
+        self.file_manager.files_about_to_reset.connect(self.on_files_about_to_reset)
+        self.file_manager.loading_started.connect(self.on_loading_started)
         
         # 规则面板信号
         self.rule_panels.rules_changed.connect(self.on_rules_changed)
@@ -489,8 +595,9 @@ class EnhancedMainWindow(QMainWindow):
             window_geometry.moveCenter(center_point)
             self.move(window_geometry.topLeft())
     
-    def on_files_loaded(self, files: List[FileItem]):
+    def on_files_loaded(self, files: List["FileItem"]):
         """文件加载完成处理"""
+        self._wait_for_preview()
         self.current_files = files
         self.rename_engine.files = files
         
@@ -504,32 +611,55 @@ class EnhancedMainWindow(QMainWindow):
         
         # 更新状态栏
         self.file_count_label.setText(f"{len(files)} 个文件")
-        self.status_label.setText(f"✅ 已加载 {len(files)} 个文件")
+        self.set_status(f"✅ 已加载 {len(files)} 个文件")
         
         # 清空规则引擎
         self.rename_engine.clear_rules()
     
-    def on_selection_changed(self, selected_files: List[FileItem]):
+    def on_loading_started(self):
+        """开始加载新目录 - 丢弃旧文件列表，扫描完成前不能预览或执行重命名"""
+        self._wait_for_preview(discard=True)
+        self.current_files = []
+        self.rename_engine.files = []
+        
+        self.preview_action.setEnabled(False)
+        self.execute_action.setEnabled(False)
+        
+        self.file_count_label.setText("正在加载...")
+    
+    def on_files_about_to_reset(self):
+        """文件项即将被重置 - 作废并等待正在进行的预览，之后才能在主线程中修改文件项"""
+        self._wait_for_preview(discard=True)
+    
+    def on_selection_changed(self, selected_files: List["FileItem"]):
         """选择变更处理"""
         count = len(selected_files)
         if count > 0:
-            self.status_label.setText(f"已选择 {count} 个文件")
+            self.set_status(f"已选择 {count} 个文件")
         else:
-            self.status_label.setText("准备就绪")
+            self.set_status("准备就绪")
     
     def on_rules_changed(self):
-        """规则变更处理"""
+        """规则变更处理 - 重新计时，合并短时间内的多次变更"""
+        self._rules_timer.start()
+    
+    def _do_rules_changed(self):
+        """根据当前规则计算预览"""
         if not self.rename_engine.files:
             return
         
         rules = self.rule_panels.get_rules()
         
+        # 新请求使尚未完成的预览作废
+        self._preview_request += 1
+        self._preview_pool.clear()
+        
         if not rules:
-            # 重置文件名
-            for file_item in self.rename_engine.files:
-                file_item.new_name = file_item.original_name
-                file_item.status = "ready"
-            self.file_manager.update_preview(self.rename_engine.files)
+            # 等待正在复制文件项的预览任务结束后再重置文件名，其结果已作废
+            self._preview_pool.waitForDone()
+            self._preview_signals.last_result = None
+            self.rename_engine.reset_preview()
+            self._push_preview()
             self.update_execute_button_state()
             return
         
@@ -538,26 +668,86 @@ class EnhancedMainWindow(QMainWindow):
         for rule in rules:
             self.rename_engine.add_rule(rule)
         
-        try:
-            preview_files = self.rename_engine.preview_rename()
-            self.file_manager.update_preview(preview_files)
-            
-            # 更新按钮状态
-            self.update_execute_button_state()
-            
-            # 更新状态
-            summary = self.rename_engine.get_rename_preview_summary()
-            if summary['conflicts'] > 0:
-                self.status_label.setText(f"⚠️ 预览完成 - {summary['conflicts']} 个冲突")
-            elif summary['will_rename'] > 0:
-                self.status_label.setText(f"✅ 预览完成 - {summary['will_rename']} 个文件将重命名")
-            else:
-                self.status_label.setText("预览完成 - 无文件需要重命名")
-                
-        except Exception as e:
-            QMessageBox.warning(self, "规则错误", f"应用规则时出错：{str(e)}")
-            self.update_execute_button_state()
-            self.status_label.setText("❌ 预览失败")
+        # 在后台计算预览，完成后由 _apply_preview 更新界面
+        worker = PreviewWorker(
+            self._preview_engine, self.rename_engine.files, rules,
+            self._preview_request, self._preview_signals
+        )
+        self._preview_pool.start(worker)
+    
+    def _apply_preview(self, request_id: int, results: list, summary: dict):
+        """预览计算完成，在主线程中把结果写回文件项"""
+        last_result = self._preview_signals.last_result
+        if request_id != self._preview_request or last_result is None or last_result[0] != request_id:
+            # 结果已过期，或已在等待预览结束时提前应用
+            return
+        self._preview_signals.last_result = None
+        
+        self._push_preview(results)
+        
+        # 更新按钮状态（直接使用预览摘要中的计数）
+        self.update_execute_button_state(summary)
+        
+        # 更新状态
+        if summary['conflicts'] > 0:
+            self.set_status(f"⚠️ 预览完成 - {summary['conflicts']} 个冲突")
+        elif summary['will_rename'] > 0:
+            self.set_status(f"✅ 预览完成 - {summary['will_rename']} 个文件将重命名")
+        else:
+            self.set_status("预览完成 - 无文件需要重命名")
+    
+    def _push_preview(self, results: Optional[list] = None):
+        """
+        把预览结果推送到文件列表，新文件名和状态都与上次相同时跳过刷新
+        
+        Args:
+            results: 后台预览得到的(新文件名, 状态)列表，为None时直接使用文件项中的结果
+        """
+        files = self.rename_engine.files
+        if results is not None:
+            for file_item, (new_name, status) in zip(files, results):
+                file_item.new_name = new_name
+                file_item.status = status
+        preview_hash = hash(tuple((f.new_name, f.status) for f in files))
+        if preview_hash == self._last_preview_hash:
+            return
+        self._last_preview_hash = preview_hash
+        self.file_manager.update_preview(files)
+    
+    def _on_preview_failed(self, request_id: int, error_message: str):
+        """预览计算出错"""
+        if request_id != self._preview_request:
+            return
+        
+        QMessageBox.warning(self, "规则错误", f"应用规则时出错：{error_message}")
+        self.update_execute_button_state()
+        self.set_status("❌ 预览失败")
+    
+    def _wait_for_preview(self, discard: bool = True):
+        """
+        等待后台预览结束，之后才能在主线程中读写文件项
+        
+        Args:
+            discard: 是否丢弃尚未送达的预览结果（后续操作会自行刷新界面）
+        """
+        if self._rules_timer.isActive():
+            self._rules_timer.stop()
+            if not discard:
+                # 规则刚变更、预览尚未开始，立即计算
+                self._do_rules_changed()
+        
+        if discard:
+            self._preview_request += 1
+            self._preview_pool.clear()
+            # 后续操作会直接修改文件项并自行刷新界面，下次预览必须重新推送
+            self._last_preview_hash = None
+        self._preview_pool.waitForDone()
+        
+        if discard:
+            self._preview_signals.last_result = None
+        elif self._preview_signals.last_result is not None:
+            # 排队中的结果信号尚未送达，直接应用，调用方随后读取的文件项即为最新预览
+            self._apply_preview(*self._preview_signals.last_result)
     
     def preview_rename(self):
         """预览重命名"""
@@ -570,6 +760,7 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.information(self, "提示", "请先设置重命名规则")
             return
         
+        self._wait_for_preview(discard=False)
         summary = self.rename_engine.get_rename_preview_summary()
         dialog = EnhancedPreviewDialog(self, summary, self.current_files)
         
@@ -582,6 +773,7 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.information(self, "提示", "请先选择文件夹！")
             return
         
+        self._wait_for_preview(discard=False)
         summary = self.rename_engine.get_rename_preview_summary()
         
         if summary['will_rename'] == 0:
@@ -589,26 +781,32 @@ class EnhancedMainWindow(QMainWindow):
             return
         
         # 确认对话框
-        reply = QMessageBox.question(
-            self, "确认重命名",
+        reply = self._confirm(
+            "确认重命名",
             f"确定要重命名 {summary['will_rename']} 个文件吗？\n\n"
             f"此操作将修改文件名，建议先备份重要文件。\n"
-            f"程序支持一步撤销功能。",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            f"程序支持一步撤销功能。"
         )
         
         if reply != QMessageBox.StandardButton.Yes:
             return
         
+        # 执行期间不再接收旧的预览结果
+        self._wait_for_preview()
+        
         # 进度对话框
-        progress = QProgressDialog("正在重命名文件...", "取消", 0, 0, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        if self._progress is None:
+            self._progress = QProgressDialog("正在重命名文件...", "取消", 0, 0, self)
+            self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._progress.setAutoClose(False)
+            self._progress.setAutoReset(False)
+        progress = self._progress
+        progress.reset()
         progress.show()
         
         try:
             success_count, error_count, error_messages = self.rename_engine.execute_rename()
-            progress.close()
+            progress.hide()
             
             # 刷新文件列表以确保与实际文件系统同步
             self.rename_engine.refresh_file_list()
@@ -630,7 +828,7 @@ class EnhancedMainWindow(QMainWindow):
                     f"成功重命名了 {success_count} 个文件！\n\n"
                     f"如需撤销，可使用撤销功能。"
                 )
-                self.status_label.setText(f"🎉 重命名完成 - {success_count} 个文件")
+                self.set_status(f"🎉 重命名完成 - {success_count} 个文件")
             else:
                 error_text = "\n".join(error_messages[:10])
                 if len(error_messages) > 10:
@@ -642,12 +840,12 @@ class EnhancedMainWindow(QMainWindow):
                     f"❌ 失败: {error_count} 个文件\n\n"
                     f"错误详情:\n{error_text}"
                 )
-                self.status_label.setText(f"⚠️ 重命名完成 - {success_count} 成功, {error_count} 失败")
+                self.set_status(f"⚠️ 重命名完成 - {success_count} 成功, {error_count} 失败")
         
         except Exception as e:
-            progress.close()
+            progress.hide()
             QMessageBox.critical(self, "❌ 重命名错误", f"重命名过程中发生错误:\n{str(e)}")
-            self.status_label.setText("❌ 重命名失败")
+            self.set_status("❌ 重命名失败")
     
     def undo_rename(self):
         """撤销重命名"""
@@ -655,38 +853,45 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.information(self, "提示", "没有可撤销的操作")
             return
         
-        reply = QMessageBox.question(
-            self, "确认撤销",
+        reply = self._confirm(
+            "确认撤销",
             "确定要撤销上一次重命名操作吗？\n\n"
-            "这将恢复所有文件的原始名称。",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            "这将恢复所有文件的原始名称。"
         )
         
         if reply != QMessageBox.StandardButton.Yes:
             return
         
+        self._wait_for_preview()
         try:
             success, message = self.rename_engine.undo_last_rename()
             
             if success:
                 QMessageBox.information(self, "✅ 撤销成功", message)
-                self.status_label.setText("✅ 撤销完成")
-                self.file_manager.refresh_files()
+                self.set_status("✅ 撤销完成")
+                
+                # 引擎已原地更新文件项，直接刷新表格行，无需重新扫描目录
+                self.file_manager.update_preview(self.rename_engine.files)
+                self.update_execute_button_state()
                 
                 if not self.rename_engine.history:
                     self.undo_action.setEnabled(False)
                     self.undo_toolbar_action.setEnabled(False)
             else:
                 QMessageBox.warning(self, "⚠️ 撤销失败", message)
-                self.status_label.setText("⚠️ 撤销失败")
+                self.set_status("⚠️ 撤销失败")
                 
         except Exception as e:
             QMessageBox.critical(self, "❌ 撤销错误", f"撤销过程中发生错误:\n{str(e)}")
     
     def toggle_theme(self):
         """切换主题"""
-        get_enhanced_theme_manager().toggle_theme()
+        # 切换样式表会重新polish整个组件树，期间暂停重绘，完成后只整体重绘一次
+        self.setUpdatesEnabled(False)
+        try:
+            get_enhanced_theme_manager().toggle_theme()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def on_theme_changed(self, theme_name: str):
         """主题变更处理"""
@@ -724,19 +929,15 @@ class EnhancedMainWindow(QMainWindow):
     
     def show_about(self):
         """显示关于对话框"""
-        dialog = EnhancedAboutDialog(self)
-        dialog.exec()
+        if self._about_dialog is None:
+            self._about_dialog = EnhancedAboutDialog(self)
+        self._about_dialog.exec()
     
     def connect_signals(self):
         """连接信号"""
         # 连接清空文件名面板的信号
         self.clear_filename_panel.clear_requested.connect(self.on_clear_filenames)
         self.clear_filename_panel.generate_requested.connect(self.on_generate_filenames)
-        
-        # 连接文件管理器的信号
-        self.file_manager.files_loaded.connect(self.on_files_loaded)
-        self.file_manager.selection_changed.connect(self.on_selection_changed)
-        
     
     def on_clear_filenames(self):
         """清空文件名"""
@@ -744,14 +945,13 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.information(self, "提示", "请先选择文件夹！")
             return
         
-        reply = QMessageBox.question(
-            self, "确认清空", 
-            f"确定要清空 {len(self.rename_engine.files)} 个文件的文件名吗？\n\n此操作将保留文件扩展名。",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+        reply = self._confirm(
+            "确认清空",
+            f"确定要清空 {len(self.rename_engine.files)} 个文件的文件名吗？\n\n此操作将保留文件扩展名。"
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            self._wait_for_preview()
             self.rename_engine.clear_all_filenames()
             self.file_manager.refresh_preview()
             self.update_status("已清空所有文件名")
@@ -764,6 +964,7 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.information(self, "提示", "请先选择文件夹！")
             return
         
+        self._wait_for_preview()
         try:
             self.rename_engine.generate_new_filenames(template, start_number, step, padding)
             self.file_manager.refresh_preview()
@@ -773,34 +974,59 @@ class EnhancedMainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "错误", f"生成文件名时出错：{str(e)}")
     
-    def on_files_loaded(self, files: List[FileItem]):
-        """文件加载完成"""
-        self.current_files = files
-        self.rename_engine.files = files
-        self.update_status(f"已加载 {len(files)} 个文件")
-        # 更新执行按钮状态
-        self.update_execute_button_state()
+    def _confirm(self, title: str, text: str) -> QMessageBox.StandardButton:
+        """
+        显示是/否确认对话框，对话框首次使用时创建，之后复用
+        
+        Returns:
+            用户点击的按钮，默认按钮为"否"
+        """
+        if self._confirm_box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Question)
+            box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            self._confirm_box = box
+        box = self._confirm_box
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        return QMessageBox.StandardButton(box.exec())
     
-    def on_selection_changed(self, selected_files: List[FileItem]):
-        """选择改变"""
-        self.update_status(f"已选择 {len(selected_files)} 个文件")
+    def set_status(self, message: str):
+        """设置状态标签文本，在下一次定时刷新时才真正更新"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
     
+    def _flush_status(self):
+        """把最新的状态文本写入状态标签"""
+        if self._pending_status is not None:
+            self.status_label.setText(self._pending_status)
+            self._pending_status = None
     
     def update_status(self, message: str):
         """更新状态栏"""
         if hasattr(self, 'status_bar'):
             self.status_bar.showMessage(message, 3000)  # 显示3秒
     
-    def update_execute_button_state(self):
-        """更新执行重命名按钮状态"""
+    def update_execute_button_state(self, summary: Optional[dict] = None):
+        """
+        更新执行重命名按钮状态
+        
+        Args:
+            summary: 刚计算出的预览摘要，提供时直接使用其计数而不再扫描文件列表
+        """
         if not hasattr(self, 'execute_action') or not self.rename_engine.files:
             return
         
         # 检查是否有文件需要重命名
-        has_changes = any(
-            f.new_name != f.original_name and f.status != "conflict" 
-            for f in self.rename_engine.files
-        )
+        if summary is not None:
+            has_changes = summary['will_rename'] > 0
+        else:
+            has_changes = any(
+                f.new_name != f.original_name and f.status != "conflict" 
+                for f in self.rename_engine.files
+            )
         
         self.execute_action.setEnabled(has_changes)
         
@@ -815,6 +1041,7 @@ class EnhancedMainWindow(QMainWindow):
             return
         
         # 刷新文件列表
+        self._wait_for_preview()
         self.rename_engine.refresh_file_list()
         
         # 更新界面显示
@@ -828,11 +1055,9 @@ class EnhancedMainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """关闭事件"""
-        reply = QMessageBox.question(
-            self, "确认退出",
-            "确定要退出批量文件重命名工具吗？",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+        reply = self._confirm(
+            "确认退出",
+            "确定要退出批量文件重命名工具吗？"
         )
         
         if reply == QMessageBox.StandardButton.Yes:
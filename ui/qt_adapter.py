@@ -2,61 +2,132 @@
 # -*- coding: utf-8 -*-
 """
 Qt适配器模块 - 支持PyQt6和PySide6
+
+导出的类在首次访问时才选择后端并从对应的Qt子模块中取出
+（PEP 562 模块级 __getattr__），之后缓存为模块属性，不再经过 __getattr__。
+只导入本模块不会加载任何Qt子模块。
 """
 
+import functools
+import importlib
+import importlib.util
+import logging
 import sys
+from typing import TYPE_CHECKING
+
+
+class QtBackendMissingError(ImportError):
+    """PyQt6 和 PySide6 均不可用"""
+
+
+# 支持的后端，按默认优先级排列
+_BACKENDS = ("PyQt6", "PySide6")
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> str:
+    """
+    选择GUI后端 - 首次需要Qt时才探测，优先使用PyQt6，失败则使用PySide6
+    
+    先用 find_spec 跳过未安装的包，再实际导入候选后端的 QtCore 确认可用；
+    已安装但无法导入（如缺少Qt运行库、二进制不兼容）的后端同样回退到下一个
+    """
+    for backend in _BACKENDS:
+        if importlib.util.find_spec(backend) is None:
+            continue
+        try:
+            _MODULES['QtCore'] = importlib.import_module(f"{backend}.QtCore")
+        except ImportError:
+            continue
+        break
+    else:
+        raise QtBackendMissingError(
+            "无法导入PyQt6或PySide6，请安装其中一个GUI框架: "
+            "pip install PyQt6 或 pip install PySide6"
+        )
+
+    logging.getLogger(__name__).debug("使用GUI后端: %s", backend)
+    return backend
+
+
+# 按Qt子模块分组的导出名称，每个名称只在这里列出一次
+_SYMBOLS = {
+    'QtCore': (
+        'Qt', 'QObject', 'QThread', 'QThreadPool', 'QRunnable', 'Signal', 'QTimer',
+        'QAbstractTableModel', 'QAbstractListModel', 'QModelIndex', 'QSortFilterProxyModel',
+        'QItemSelection', 'QItemSelectionModel', 'QDir',
+    ),
+    'QtGui': (
+        'QIcon', 'QAction', 'QFont', 'QPixmap', 'QPalette', 'QColor', 'QTextDocument',
+    ),
+    'QtWidgets': (
+        'QApplication', 'QMainWindow', 'QWidget',
+        'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout',
+        'QPushButton', 'QLabel', 'QLineEdit', 'QComboBox', 'QCheckBox', 'QGroupBox',
+        'QSpinBox', 'QTextEdit', 'QTabWidget', 'QScrollArea', 'QFrame', 'QSplitter',
+        'QMessageBox', 'QButtonGroup', 'QRadioButton',
+        'QTableView', 'QListView', 'QFileDialog', 'QHeaderView', 'QAbstractItemView',
+        'QProgressBar', 'QProgressDialog', 'QDialog', 'QDialogButtonBox', 'QMenu',
+    ),
+}
+
+# 导出名称 -> 所在的Qt子模块
+_LAZY = {name: submodule for submodule, names in _SYMBOLS.items() for name in names}
+
+# 各后端中与导出名称不同的类名
+_RENAMES = {
+    "PyQt6": {'Signal': 'pyqtSignal'},
+    "PySide6": {},
+}
 
-# 尝试导入PyQt6，如果失败则使用PySide6
-try:
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal as Signal, QTimer
-    from PyQt6.QtGui import QIcon, QAction, QFont, QPixmap, QPalette, QColor
-    from PyQt6.QtWidgets import (
-        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
+# 已导入的Qt子模块，按名称（QtCore/QtGui/QtWidgets）缓存模块对象
+_MODULES = {}
+
+
+def _submodule(submodule: str):
+    """获取后端的Qt子模块，每个子模块只导入一次"""
+    module = _MODULES.get(submodule)
+    if module is None:
+        module = _MODULES[submodule] = importlib.import_module(f"{_backend()}.{submodule}")
+    return module
+
+
+def __getattr__(name):
+    """首次访问导出名称时从Qt子模块中取出，并缓存为模块属性"""
+    if name == 'QT_BACKEND':
+        value = _backend()
+    else:
+        try:
+            submodule = _LAZY[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+        value = getattr(_submodule(submodule), _RENAMES[_backend()].get(name, name))
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# 静态类型检查器不会执行 __getattr__，这里为其提供真实的导入
+if TYPE_CHECKING:
+    from PySide6.QtCore import (
+        Qt, QObject, QThread, QThreadPool, QRunnable, Signal, QTimer,
+        QAbstractTableModel, QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+        QItemSelection, QItemSelectionModel, QDir
+    )
+    from PySide6.QtGui import QIcon, QAction, QFont, QPixmap, QPalette, QColor, QTextDocument
+    from PySide6.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
         QFormLayout, QPushButton, QLabel, QLineEdit, QComboBox, QCheckBox, QGroupBox,
         QSpinBox, QTextEdit, QTabWidget, QScrollArea, QFrame, QSplitter,
-        QMessageBox, QButtonGroup, QRadioButton, QTableWidget, QTableWidgetItem,
-        QFileDialog, QHeaderView, QAbstractItemView, QProgressBar, QProgressDialog,
-        QDialog, QDialogButtonBox, QMenuBar, QToolBar, QStatusBar, QMenu
+        QMessageBox, QButtonGroup, QRadioButton,
+        QTableView, QListView, QFileDialog, QHeaderView, QAbstractItemView, QProgressBar, QProgressDialog,
+        QDialog, QDialogButtonBox, QMenu
     )
-    
-    QT_BACKEND = "PyQt6"
-    print(f"使用GUI后端: {QT_BACKEND}")
-    
-except ImportError:
-    try:
-        from PySide6.QtCore import Qt, QThread, Signal, QTimer
-        from PySide6.QtGui import QIcon, QAction, QFont, QPixmap, QPalette, QColor
-        from PySide6.QtWidgets import (
-            QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-            QFormLayout, QPushButton, QLabel, QLineEdit, QComboBox, QCheckBox, QGroupBox,
-            QSpinBox, QTextEdit, QTabWidget, QScrollArea, QFrame, QSplitter,
-            QMessageBox, QButtonGroup, QRadioButton, QTableWidget, QTableWidgetItem,
-            QFileDialog, QHeaderView, QAbstractItemView, QProgressBar, QProgressDialog,
-            QDialog, QDialogButtonBox, QMenuBar, QToolBar, QStatusBar, QMenu
-        )
-        
-        QT_BACKEND = "PySide6"
-        print(f"使用GUI后端: {QT_BACKEND}")
-        
-    except ImportError:
-        print("错误：无法导入PyQt6或PySide6")
-        print("请安装其中一个GUI框架:")
-        print("pip install PyQt6")
-        print("或")
-        print("pip install PySide6")
-        sys.exit(1)
 
 
 # 导出所有需要的类和常量
-__all__ = [
-    'Qt', 'QThread', 'Signal', 'QTimer',
-    'QIcon', 'QAction', 'QFont', 'QPixmap', 'QPalette', 'QColor',
-    'QApplication', 'QMainWindow', 'QWidget', 
-    'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout',
-    'QPushButton', 'QLabel', 'QLineEdit', 'QComboBox', 'QCheckBox', 'QGroupBox',
-    'QSpinBox', 'QTextEdit', 'QTabWidget', 'QScrollArea', 'QFrame', 'QSplitter',
-    'QMessageBox', 'QButtonGroup', 'QRadioButton', 'QTableWidget', 'QTableWidgetItem',
-    'QFileDialog', 'QHeaderView', 'QAbstractItemView', 'QProgressBar', 'QProgressDialog',
-    'QDialog', 'QDialogButtonBox', 'QMenuBar', 'QToolBar', 'QStatusBar', 'QMenu',
-    'QT_BACKEND'
-]
+__all__ = [*_LAZY, 'QT_BACKEND', 'QtBackendMissingError']
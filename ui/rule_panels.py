@@ -6,17 +6,33 @@
 """
 
 import re
+from contextlib import contextmanager
 from typing import List, Optional
 
 from ui.qt_adapter import (
-    Qt, Signal, QFont,
+    Qt, Signal, QFont, QTimer,
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
     QPushButton, QLabel, QLineEdit, QComboBox, QCheckBox, QGroupBox,
     QSpinBox, QTextEdit, QTabWidget, QScrollArea, QFrame, QSplitter,
     QMessageBox, QButtonGroup, QRadioButton
 )
 
-from core.rename_engine import RenameRule, RenameMode, CaseMode
+from core.rename_engine import RenameRule, RenameMode, CaseMode, compile_pattern, compile_template
+
+
+# 正则面板的常用模式 (按钮文字, 模式, 替换文本)
+_COMMON_PATTERNS = (
+    ("删除数字", r"\d+", ""),
+    ("删除括号内容", r"\([^)]*\)", ""),
+    ("删除方括号内容", r"\[[^\]]*\]", ""),
+    ("替换空格为下划线", r"\s+", "_"),
+    ("删除特殊字符", r"[^\w\s\.]", "")
+)
+
+# 常用模式在导入时预先编译进共享缓存，选用后校验和预览直接命中
+for _name, _pattern, _replacement in _COMMON_PATTERNS:
+    compile_pattern(_pattern)
+del _name, _pattern, _replacement
 
 
 class BaseRulePanel(QWidget):
@@ -34,36 +50,40 @@ class BaseRulePanel(QWidget):
         """设置界面"""
         layout = QVBoxLayout(self)
         
-        # 标题和启用复选框
-        header_layout = QHBoxLayout()
-        
+        # 标题和启用复选框（左对齐，保持自身宽度）
         self.enable_cb = QCheckBox(title)
         self.enable_cb.setChecked(True)
         self.enable_cb.setFont(QFont("", 10, QFont.Weight.Bold))
         self.enable_cb.toggled.connect(self.on_enabled_changed)
         
-        header_layout.addWidget(self.enable_cb)
-        header_layout.addStretch()
-        
-        layout.addLayout(header_layout)
+        layout.addWidget(self.enable_cb, 0, Qt.AlignmentFlag.AlignLeft)
         
-        # 内容区域
+        # 内容区域 - 子控件在面板首次显示或首次读写规则时才创建
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
-        self.setup_content()
+        self._content_built = False
         
         layout.addWidget(self.content_widget)
         
-        # 分隔线
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(line)
+        # 分隔线由主题样式表中 #rulePanel 的下边框绘制，不再单独创建 QFrame
+        self.setObjectName("rulePanel")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
     
     def setup_content(self):
         """设置内容区域 - 子类重写"""
         pass
     
+    def ensure_content(self):
+        """确保内容区域已创建"""
+        if not self._content_built:
+            self._content_built = True
+            self.setup_content()
+    
+    def showEvent(self, event):
+        """首次显示时创建内容区域"""
+        self.ensure_content()
+        super().showEvent(event)
+    
     def on_enabled_changed(self, enabled: bool):
         """启用状态变更"""
         self.enabled = enabled
@@ -74,6 +94,25 @@ class BaseRulePanel(QWidget):
         """发射规则变更信号"""
         self.rule_changed.emit()
     
+    def _add_line(self, form: QFormLayout, label: str, placeholder: str = "",
+                  text: str = "", on_changed=None) -> QLineEdit:
+        """在表单中添加一行文本输入框，内容变更时默认发射规则变更信号"""
+        edit = QLineEdit(text)
+        edit.setPlaceholderText(placeholder)
+        edit.textChanged.connect(on_changed or self.emit_rule_changed)
+        form.addRow(label, edit)
+        return edit
+    
+    def _add_spin(self, form: QFormLayout, label: str, minimum: int, maximum: int,
+                  value: int, on_changed=None) -> QSpinBox:
+        """在表单中添加一行数字输入框，数值变更时默认发射规则变更信号"""
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setValue(value)
+        spin.valueChanged.connect(on_changed or self.emit_rule_changed)
+        form.addRow(label, spin)
+        return spin
+    
     def get_rule(self) -> Optional[RenameRule]:
         """获取规则 - 子类重写"""
         return None
@@ -95,16 +134,10 @@ class ReplaceRulePanel(BaseRulePanel):
         self.content_layout.addLayout(form_layout)
         
         # 查找文本
-        self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText("要替换的文本...")
-        self.search_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("查找:", self.search_edit)
+        self.search_edit = self._add_line(form_layout, "查找:", "要替换的文本...")
         
         # 替换文本
-        self.replace_edit = QLineEdit()
-        self.replace_edit.setPlaceholderText("替换为...")
-        self.replace_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("替换为:", self.replace_edit)
+        self.replace_edit = self._add_line(form_layout, "替换为:", "替换为...")
         
         # 区分大小写
         self.case_sensitive_cb = QCheckBox("区分大小写")
@@ -141,8 +174,7 @@ class AddTextRulePanel(BaseRulePanel):
         
     def setup_content(self):
         """设置内容区域"""
-        layout = QVBoxLayout()
-        self.content_layout.addLayout(layout)
+        layout = self.content_layout
         
         # 位置选择
         position_group = QGroupBox("添加位置")
@@ -165,11 +197,7 @@ class AddTextRulePanel(BaseRulePanel):
         
         # 添加文本
         form_layout = QFormLayout()
-        
-        self.text_edit = QLineEdit()
-        self.text_edit.setPlaceholderText("要添加的文本...")
-        self.text_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("文本:", self.text_edit)
+        self.text_edit = self._add_line(form_layout, "文本:", "要添加的文本...")
         
         layout.addWidget(position_group)
         layout.addLayout(form_layout)
@@ -215,32 +243,18 @@ class IndexRulePanel(BaseRulePanel):
         self.content_layout.addLayout(form_layout)
         
         # 序号模板
-        self.template_edit = QLineEdit()
-        self.template_edit.setText("{index}")
-        self.template_edit.setPlaceholderText("序号模板 (使用 {index} 作为占位符)")
-        self.template_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("模板:", self.template_edit)
+        self.template_edit = self._add_line(
+            form_layout, "模板:", "序号模板 (使用 {index} 作为占位符)", text="{index}"
+        )
         
         # 起始数字
-        self.start_spin = QSpinBox()
-        self.start_spin.setRange(0, 99999)
-        self.start_spin.setValue(1)
-        self.start_spin.valueChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("起始数字:", self.start_spin)
+        self.start_spin = self._add_spin(form_layout, "起始数字:", 0, 99999, 1)
         
         # 步长
-        self.step_spin = QSpinBox()
-        self.step_spin.setRange(1, 1000)
-        self.step_spin.setValue(1)
-        self.step_spin.valueChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("步长:", self.step_spin)
+        self.step_spin = self._add_spin(form_layout, "步长:", 1, 1000, 1)
         
         # 位数
-        self.padding_spin = QSpinBox()
-        self.padding_spin.setRange(1, 10)
-        self.padding_spin.setValue(3)
-        self.padding_spin.valueChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("位数:", self.padding_spin)
+        self.padding_spin = self._add_spin(form_layout, "位数:", 1, 10, 3)
         
         # 示例
         self.example_label = QLabel()
@@ -299,27 +313,29 @@ class DeleteCharsRulePanel(BaseRulePanel):
         self.content_layout.addLayout(form_layout)
         
         # 删除位置
-        self.start_spin = QSpinBox()
-        self.start_spin.setRange(0, 1000)
-        self.start_spin.setValue(0)
-        self.start_spin.valueChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("开始位置:", self.start_spin)
-        
-        self.end_spin = QSpinBox()
-        self.end_spin.setRange(1, 1000)
-        self.end_spin.setValue(1)
-        self.end_spin.valueChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("结束位置:", self.end_spin)
+        self.start_spin = self._add_spin(
+            form_layout, "开始位置:", 0, 999, 0, on_changed=self.on_start_changed
+        )
+        self.end_spin = self._add_spin(form_layout, "结束位置:", 1, 1000, 1)
         
         # 说明
         info_label = QLabel("删除从开始位置到结束位置之间的字符")
-        info_label.setStyleSheet("color: #666; font-size: 12px;")
+        info_label.setObjectName("ruleHint")
         form_layout.addRow("", info_label)
     
+    def on_start_changed(self, start: int):
+        """开始位置变更处理 - 结束位置至少比开始位置大1，保证删除范围有效"""
+        self.end_spin.setMinimum(start + 1)
+        self.emit_rule_changed()
+    
     def get_rule(self) -> Optional[RenameRule]:
         """获取删除字符规则"""
         if not self.enabled:
             return None
+        
+        # 删除范围为空时规则不产生效果，不必参与预览
+        if self.start_spin.value() >= self.end_spin.value():
+            return None
             
         return RenameRule(
             mode=self.mode,
@@ -338,6 +354,15 @@ class DeleteCharsRulePanel(BaseRulePanel):
 class CaseChangeRulePanel(BaseRulePanel):
     """大小写转换规则面板"""
     
+    # 选项文本与大小写模式的双向对照表
+    _CASE_FROM_TEXT = {
+        "全部小写": CaseMode.LOWER,
+        "全部大写": CaseMode.UPPER,
+        "首字母大写": CaseMode.TITLE,
+        "句首大写": CaseMode.SENTENCE
+    }
+    _TEXT_FROM_CASE = {mode: text for text, mode in _CASE_FROM_TEXT.items()}
+    
     def __init__(self):
         super().__init__("大小写转换", RenameMode.CASE_CHANGE)
         
@@ -348,12 +373,7 @@ class CaseChangeRulePanel(BaseRulePanel):
         
         # 转换模式
         self.case_combo = QComboBox()
-        self.case_combo.addItems([
-            "全部小写",
-            "全部大写", 
-            "首字母大写",
-            "句首大写"
-        ])
+        self.case_combo.addItems(list(self._CASE_FROM_TEXT))
         self.case_combo.currentTextChanged.connect(self.emit_rule_changed)
         form_layout.addRow("转换模式:", self.case_combo)
     
@@ -361,29 +381,16 @@ class CaseChangeRulePanel(BaseRulePanel):
         """获取大小写转换规则"""
         if not self.enabled:
             return None
-            
-        case_modes = {
-            "全部小写": CaseMode.LOWER,
-            "全部大写": CaseMode.UPPER,
-            "首字母大写": CaseMode.TITLE,
-            "句首大写": CaseMode.SENTENCE
-        }
         
         return RenameRule(
             mode=self.mode,
             enabled=self.enabled,
-            case_mode=case_modes[self.case_combo.currentText()]
+            case_mode=self._CASE_FROM_TEXT[self.case_combo.currentText()]
         )
     
     def set_rule(self, rule: RenameRule):
         """设置大小写转换规则"""
-        case_texts = {
-            CaseMode.LOWER: "全部小写",
-            CaseMode.UPPER: "全部大写",
-            CaseMode.TITLE: "首字母大写",
-            CaseMode.SENTENCE: "句首大写"
-        }
-        self.case_combo.setCurrentText(case_texts[rule.case_mode])
+        self.case_combo.setCurrentText(self._TEXT_FROM_CASE[rule.case_mode])
         self.enable_cb.setChecked(rule.enabled)
 
 
@@ -395,21 +402,15 @@ class RegexRulePanel(BaseRulePanel):
         
     def setup_content(self):
         """设置内容区域"""
-        layout = QVBoxLayout()
-        self.content_layout.addLayout(layout)
+        layout = self.content_layout
         
         # 正则表达式
         form_layout = QFormLayout()
         
-        self.pattern_edit = QLineEdit()
-        self.pattern_edit.setPlaceholderText("正则表达式模式...")
-        self.pattern_edit.textChanged.connect(self.on_pattern_changed)
-        form_layout.addRow("模式:", self.pattern_edit)
-        
-        self.replace_edit = QLineEdit()
-        self.replace_edit.setPlaceholderText("替换为...")
-        self.replace_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("替换为:", self.replace_edit)
+        self.pattern_edit = self._add_line(
+            form_layout, "模式:", "正则表达式模式...", on_changed=self.on_pattern_changed
+        )
+        self.replace_edit = self._add_line(form_layout, "替换为:", "替换为...")
         
         # 标志
         flags_layout = QHBoxLayout()
@@ -435,17 +436,11 @@ class RegexRulePanel(BaseRulePanel):
         patterns_group = QGroupBox("常用模式")
         patterns_layout = QVBoxLayout(patterns_group)
         
-        common_patterns = [
-            ("删除数字", r"\d+", ""),
-            ("删除括号内容", r"\([^)]*\)", ""),
-            ("删除方括号内容", r"\[[^\]]*\]", ""),
-            ("替换空格为下划线", r"\s+", "_"),
-            ("删除特殊字符", r"[^\w\s\.]", "")
-        ]
-        
-        for name, pattern, replacement in common_patterns:
+        for name, pattern, replacement in _COMMON_PATTERNS:
             btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, p=pattern, r=replacement: self.set_pattern(p, r))
+            btn.setProperty("pattern", pattern)
+            btn.setProperty("replacement", replacement)
+            btn.clicked.connect(self.on_common_pattern_clicked)
             patterns_layout.addWidget(btn)
         
         layout.addWidget(patterns_group)
@@ -455,6 +450,11 @@ class RegexRulePanel(BaseRulePanel):
         self.pattern_edit.setText(pattern)
         self.replace_edit.setText(replacement)
     
+    def on_common_pattern_clicked(self):
+        """常用模式按钮点击处理 - 模式和替换文本保存在按钮属性中"""
+        button = self.sender()
+        self.set_pattern(button.property("pattern"), button.property("replacement"))
+    
     def on_pattern_changed(self):
         """模式变更处理"""
         pattern = self.pattern_edit.text()
@@ -465,7 +465,8 @@ class RegexRulePanel(BaseRulePanel):
             return
             
         try:
-            re.compile(pattern)
+            # 按规则实际使用的标志编译，引擎套用规则时直接命中同一缓存
+            compile_pattern(pattern, self.get_regex_flags())
             self.status_label.setText("✓ 正则表达式有效")
             self.status_label.setStyleSheet("color: green;")
         except re.error as e:
@@ -479,20 +480,23 @@ class RegexRulePanel(BaseRulePanel):
         if not self.enabled or not self.pattern_edit.text():
             return None
             
-        flags = 0
-        if self.ignore_case_cb.isChecked():
-            flags |= re.IGNORECASE
-        if self.multiline_cb.isChecked():
-            flags |= re.MULTILINE
-            
         return RenameRule(
             mode=self.mode,
             enabled=self.enabled,
             regex_pattern=self.pattern_edit.text(),
             replace_text=self.replace_edit.text(),
-            regex_flags=flags
+            regex_flags=self.get_regex_flags()
         )
     
+    def get_regex_flags(self) -> int:
+        """根据复选框获取正则表达式标志"""
+        flags = 0
+        if self.ignore_case_cb.isChecked():
+            flags |= re.IGNORECASE
+        if self.multiline_cb.isChecked():
+            flags |= re.MULTILINE
+        return flags
+    
     def set_rule(self, rule: RenameRule):
         """设置正则表达式规则"""
         self.pattern_edit.setText(rule.regex_pattern)
@@ -514,14 +518,11 @@ class ExtensionRulePanel(BaseRulePanel):
         self.content_layout.addLayout(form_layout)
         
         # 新扩展名
-        self.extension_edit = QLineEdit()
-        self.extension_edit.setPlaceholderText("新扩展名 (如: .txt)")
-        self.extension_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("新扩展名:", self.extension_edit)
+        self.extension_edit = self._add_line(form_layout, "新扩展名:", "新扩展名 (如: .txt)")
         
         # 警告
         warning_label = QLabel("⚠️ 修改扩展名可能影响文件的打开方式")
-        warning_label.setStyleSheet("color: #ff9800; font-size: 12px;")
+        warning_label.setObjectName("ruleWarning")
         form_layout.addRow("", warning_label)
     
     def get_rule(self) -> Optional[RenameRule]:
@@ -544,13 +545,22 @@ class ExtensionRulePanel(BaseRulePanel):
 class DateTimeRulePanel(BaseRulePanel):
     """日期时间规则面板"""
     
+    # 可选的日期格式及示例，下拉框按此顺序排列
+    _DATE_FORMATS = [
+        ("%Y%m%d", "20240101"),
+        ("%Y-%m-%d", "2024-01-01"),
+        ("%Y%m%d_%H%M%S", "20240101_120000"),
+        ("%Y-%m-%d_%H-%M-%S", "2024-01-01_12-00-00")
+    ]
+    # 日期格式 -> 下拉框索引
+    _FORMAT_INDEX = {date_format: i for i, (date_format, _) in enumerate(_DATE_FORMATS)}
+    
     def __init__(self):
         super().__init__("添加日期时间", RenameMode.DATE_TIME)
         
     def setup_content(self):
         """设置内容区域"""
-        layout = QVBoxLayout()
-        self.content_layout.addLayout(layout)
+        layout = self.content_layout
         
         # 日期来源
         source_group = QGroupBox("日期来源")
@@ -570,21 +580,14 @@ class DateTimeRulePanel(BaseRulePanel):
         form_layout = QFormLayout()
         
         self.format_combo = QComboBox()
-        self.format_combo.addItems([
-            "%Y%m%d - 20240101",
-            "%Y-%m-%d - 2024-01-01", 
-            "%Y%m%d_%H%M%S - 20240101_120000",
-            "%Y-%m-%d_%H-%M-%S - 2024-01-01_12-00-00"
-        ])
+        self.format_combo.addItems([f"{date_format} - {example}" for date_format, example in self._DATE_FORMATS])
         self.format_combo.currentTextChanged.connect(self.emit_rule_changed)
         form_layout.addRow("格式:", self.format_combo)
         
         # 模板
-        self.template_edit = QLineEdit()
-        self.template_edit.setText("{date}")
-        self.template_edit.setPlaceholderText("模板 (使用 {date} 作为占位符)")
-        self.template_edit.textChanged.connect(self.emit_rule_changed)
-        form_layout.addRow("模板:", self.template_edit)
+        self.template_edit = self._add_line(
+            form_layout, "模板:", "模板 (使用 {date} 作为占位符)", text="{date}"
+        )
         
         layout.addWidget(source_group)
         layout.addLayout(form_layout)
@@ -594,9 +597,7 @@ class DateTimeRulePanel(BaseRulePanel):
         if not self.enabled:
             return None
             
-        # 提取日期格式
-        format_text = self.format_combo.currentText()
-        date_format = format_text.split(" - ")[0]
+        date_format = self._DATE_FORMATS[self.format_combo.currentIndex()][0]
         
         return RenameRule(
             mode=self.mode,
@@ -611,10 +612,9 @@ class DateTimeRulePanel(BaseRulePanel):
         self.template_edit.setText(rule.replace_text)
         
         # 设置日期格式
-        for i in range(self.format_combo.count()):
-            if rule.date_format in self.format_combo.itemText(i):
-                self.format_combo.setCurrentIndex(i)
-                break
+        index = self._FORMAT_INDEX.get(rule.date_format)
+        if index is not None:
+            self.format_combo.setCurrentIndex(index)
         
         if rule.use_create_date:
             self.create_date_rb.setChecked(True)
@@ -632,6 +632,13 @@ class RulePanelsWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.rule_panels = []
+        
+        # 同一次事件循环中多个面板发出的变更合并为一次 rules_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.rules_changed.emit)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -665,9 +672,14 @@ class RulePanelsWidget(QWidget):
             DateTimeRulePanel()
         ]
         
+        # 重命名模式 -> 面板；添加文本面板同时负责前缀和后缀两种模式
+        self._panels_by_mode = {panel.mode: panel for panel in self.rule_panels}
+        add_text_panel = self._panels_by_mode[RenameMode.ADD_PREFIX]
+        self._panels_by_mode[RenameMode.ADD_SUFFIX] = add_text_panel
+        
         # 连接信号
         for panel in self.rule_panels:
-            panel.rule_changed.connect(self.rules_changed.emit)
+            panel.rule_changed.connect(self._emit_timer.start)
             rules_layout.addWidget(panel)
         
         rules_layout.addStretch()
@@ -694,29 +706,47 @@ class RulePanelsWidget(QWidget):
         """获取所有规则"""
         rules = []
         for panel in self.rule_panels:
+            # 未启用的面板不产生规则，无需读取其控件
+            if not panel.enabled:
+                continue
+            panel.ensure_content()
             rule = panel.get_rule()
             if rule:
                 rules.append(rule)
         return rules
     
+    @contextmanager
+    def _bulk_update(self):
+        """批量修改面板期间屏蔽各面板的规则变更信号，完成后只发射一次 rules_changed"""
+        for panel in self.rule_panels:
+            panel.blockSignals(True)
+        try:
+            yield
+        finally:
+            for panel in self.rule_panels:
+                panel.blockSignals(False)
+        self._emit_timer.stop()
+        self.rules_changed.emit()
+    
     def set_rules(self, rules: List[RenameRule]):
         """设置规则"""
-        # 重置所有面板
-        for panel in self.rule_panels:
-            panel.enable_cb.setChecked(False)
-        
-        # 应用规则
-        for rule in rules:
+        with self._bulk_update():
+            # 重置所有面板
             for panel in self.rule_panels:
-                if panel.mode == rule.mode:
+                panel.enable_cb.setChecked(False)
+            
+            # 应用规则
+            for rule in rules:
+                panel = self._panels_by_mode.get(rule.mode)
+                if panel is not None:
+                    panel.ensure_content()
                     panel.set_rule(rule)
-                    break
     
     def clear_rules(self):
         """清空所有规则"""
-        for panel in self.rule_panels:
-            panel.enable_cb.setChecked(False)
-        self.rules_changed.emit()
+        with self._bulk_update():
+            for panel in self.rule_panels:
+                panel.enable_cb.setChecked(False)
     
     def get_enabled_rules_count(self) -> int:
         """获取启用的规则数量"""
@@ -748,7 +778,7 @@ class ClearFilenamePanel(QWidget):
         
         # 说明文本
         desc_label = QLabel("清空所有文件名，然后根据模板生成新的文件名")
-        desc_label.setStyleSheet("color: #666; font-size: 12px; margin-bottom: 10px;")
+        desc_label.setObjectName("clearPanelDescription")
         layout.addWidget(desc_label)
         
         # 清空按钮
@@ -756,26 +786,7 @@ class ClearFilenamePanel(QWidget):
         clear_layout = QVBoxLayout(clear_group)
         
         self.clear_btn = QPushButton("清空所有文件名")
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #ee5a52);
-                color: white;
-                border: 1px solid #e74c3c;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ee5a52, stop:1 #e74c3c);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #c0392b);
-            }
-        """)
+        self.clear_btn.setObjectName("clearFilenamesButton")
         self.clear_btn.clicked.connect(self.clear_requested.emit)
         clear_layout.addWidget(self.clear_btn)
         
@@ -793,7 +804,7 @@ class ClearFilenamePanel(QWidget):
         
         # 模板说明
         template_help = QLabel("占位符: {n}=序号, {ext}=扩展名, {name}=原文件名, {dir}=文件夹名")
-        template_help.setStyleSheet("color: #666; font-size: 11px; margin-top: 2px;")
+        template_help.setObjectName("clearPanelTemplateHelp")
         template_help.setWordWrap(True)  # 启用自动换行
         generate_layout.addRow("", template_help)
         
@@ -826,26 +837,7 @@ class ClearFilenamePanel(QWidget):
         
         # 生成按钮
         self.generate_btn = QPushButton("生成新文件名")
-        self.generate_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ecdc4, stop:1 #44a08d);
-                color: white;
-                border: 1px solid #26a69a;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #44a08d, stop:1 #26a69a);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #26a69a, stop:1 #00695c);
-            }
-        """)
+        self.generate_btn.setObjectName("generateFilenamesButton")
         self.generate_btn.clicked.connect(self.on_generate_clicked)
         generate_layout.addRow("", self.generate_btn)
         
@@ -896,10 +888,11 @@ class ClearFilenamePanel(QWidget):
             step = self.step_spin.value()
             padding = self.padding_spin.value()
             
+            render = compile_template(template)
             preview_lines = []
             for i in range(3):  # 显示3个示例
                 number = start + i * step
-                example_name = template.format(
+                example_name = render(
                     n=str(number).zfill(padding),
                     ext=".txt",
                     name="原文件名",
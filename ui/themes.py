@@ -6,14 +6,16 @@
 """
 
 import os
+import re
 import sys
-from ui.qt_adapter import QApplication, Signal, QPalette, QColor
-from ui.qt_adapter import QWidget as QObject
+from functools import lru_cache
+from ui.qt_adapter import QApplication, QDir, QObject, Signal, QPalette, QColor
 from enum import Enum
 
 
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
-    """获取资源文件的绝对路径，兼容开发环境和打包环境"""
+    """获取资源文件的绝对路径，兼容开发环境和打包环境（进程内路径不变，结果按相对路径缓存）"""
     try:
         # PyInstaller打包后的临时目录
         base_path = sys._MEIPASS
@@ -26,67 +28,149 @@ def get_resource_path(relative_path):
     return full_path.replace("\\", "/")
 
 
-class ThemeMode(Enum):
-    """主题模式枚举"""
-    LIGHT = "light"
-    DARK = "dark"
-    BLUE = "blue"  # 新增蓝色专业主题
+# 压缩样式表用：注释、连续空白、符号两侧的空白
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACES = re.compile(r"\s+")
+_QSS_PUNCT_SPACES = re.compile(r"\s*([{};:,])\s*")
 
 
-class EnhancedThemeManager(QObject):
-    """增强版主题管理器"""
-    
-    theme_changed = Signal(str)
-    
-    def __init__(self):
-        super().__init__()
-        self.current_theme = ThemeMode.LIGHT
+def _minify_qss(stylesheet: str) -> str:
+    """压缩样式表 - 去掉注释和多余空白，减少Qt解析样式表的工作量"""
+    stylesheet = _QSS_COMMENT.sub("", stylesheet)
+    stylesheet = _QSS_SPACES.sub(" ", stylesheet)
+    return _QSS_PUNCT_SPACES.sub(r"\1", stylesheet).strip()
+
+
+# 各主题共用的组件样式（按objectName匹配），随主题样式表一次性设置，
+# 避免在各个组件上单独调用setStyleSheet
+WIDGET_STYLESHEET = """
+        /* 欢迎页 */
+        QLabel#welcomeTitle {
+            color: #1976d2;
+            margin: 20px;
+            font-size: 24pt;
+            font-weight: bold;
+        }
         
-    def set_theme(self, theme_mode: ThemeMode):
-        """设置主题"""
-        self.current_theme = theme_mode
+        QLabel#welcomeSubtitle {
+            color: #666;
+            margin: 20px;
+            font-size: 14pt;
+        }
         
-        if theme_mode == ThemeMode.BLUE:
-            self._apply_blue_theme()
-        else:
-            self._apply_light_theme()  # 默认使用亮色主题
+        QLabel#welcomeFeatures {
+            color: #424242;
+            margin: 20px;
+        }
         
-        self.theme_changed.emit(theme_mode.value)
-    
-    def toggle_theme(self):
-        """循环切换主题"""
-        themes = [ThemeMode.LIGHT, ThemeMode.BLUE]  # 移除DARK主题
-        current_index = themes.index(self.current_theme)
-        next_index = (current_index + 1) % len(themes)
-        self.set_theme(themes[next_index])
-    
-    def _apply_light_theme(self):
-        """应用亮色主题"""
-        app = QApplication.instance()
-        if app:
-            checkmark_path = get_resource_path("static/对勾1.png")
-            stylesheet = self.get_light_stylesheet().replace("{checkmark_path}", checkmark_path)
-            app.setStyleSheet(stylesheet)
-    
-    def _apply_dark_theme(self):
-        """应用暗色主题"""
-        app = QApplication.instance()
-        if app:
-            checkmark_path = get_resource_path("static/对勾1.png")
-            stylesheet = self.get_dark_stylesheet().replace("{checkmark_path}", checkmark_path)
-            app.setStyleSheet(stylesheet)
-            
-    def _apply_blue_theme(self):
-        """应用蓝色专业主题"""
-        app = QApplication.instance()
-        if app:
-            checkmark_path = get_resource_path("static/对勾1.png")
-            stylesheet = self.get_blue_stylesheet().replace("{checkmark_path}", checkmark_path)
-            app.setStyleSheet(stylesheet)
-    
-    def get_light_stylesheet(self) -> str:
-        """获取亮色主题样式表"""
-        return """
+        QLabel#welcomeStart {
+            color: #1976d2;
+            margin: 20px;
+            font-size: 12pt;
+            font-weight: bold;
+        }
+        
+        /* 预览对话框 */
+        QLabel#previewSummary {
+            font-size: 12pt;
+        }
+        
+        QLabel#previewWarning {
+            color: #ff9800;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        
+        QPushButton#previewExecuteButton {
+            font-weight: bold;
+            font-size: 14px;
+        }
+        
+        /* 关于对话框 */
+        QLabel#aboutIcon {
+            font-size: 48px;
+        }
+        
+        QLabel#aboutTitle {
+            font-size: 18pt;
+            font-weight: bold;
+        }
+        
+        QLabel#aboutVersion {
+            color: #666;
+        }
+        
+        /* 规则面板 */
+        QWidget#rulePanel {
+            border-bottom: 1px solid palette(mid);
+        }
+        
+        /* 规则面板提示 */
+        QLabel#ruleHint {
+            color: #666;
+            font-size: 12px;
+        }
+        
+        QLabel#ruleWarning {
+            color: #ff9800;
+            font-size: 12px;
+        }
+        
+        /* 清空文件名面板 */
+        QLabel#clearPanelDescription {
+            color: #666;
+            font-size: 12px;
+            margin-bottom: 10px;
+        }
+        
+        QLabel#clearPanelTemplateHelp {
+            color: #666;
+            font-size: 11px;
+            margin-top: 2px;
+        }
+        
+        QPushButton#clearFilenamesButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #ff6b6b, stop:1 #ee5a52);
+            color: white;
+            border: 1px solid #e74c3c;
+            border-radius: 6px;
+            padding: 12px 24px;
+            font-weight: 600;
+            font-size: 13px;
+        }
+        QPushButton#clearFilenamesButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #ee5a52, stop:1 #e74c3c);
+        }
+        QPushButton#clearFilenamesButton:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #e74c3c, stop:1 #c0392b);
+        }
+        
+        QPushButton#generateFilenamesButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #4ecdc4, stop:1 #44a08d);
+            color: white;
+            border: 1px solid #26a69a;
+            border-radius: 6px;
+            padding: 12px 24px;
+            font-weight: 600;
+            font-size: 13px;
+        }
+        QPushButton#generateFilenamesButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #44a08d, stop:1 #26a69a);
+        }
+        QPushButton#generateFilenamesButton:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #26a69a, stop:1 #00695c);
+        }
+"""
+
+
+# 亮色主题样式表
+_LIGHT_QSS = """
         /* 亮色主题 - 风格 */
         QMainWindow {
             background-color: #f8f9fa;
@@ -195,7 +279,7 @@ class EnhancedThemeManager(QObject):
         }
         
         /* 表格样式 - 增强版 */
-        QTableWidget {
+        QTableView {
             background-color: white;
             alternate-background-color: #f8f9fa;
             gridline-color: #e0e0e0;
@@ -205,19 +289,19 @@ class EnhancedThemeManager(QObject):
             font-size: 13px;
         }
         
-        QTableWidget::item {
+        QTableView::item {
             padding: 12px 8px;
             border: none;
             border-bottom: 1px solid #f0f0f0;
         }
         
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #e3f2fd, stop:1 #bbdefb);
             color: #1976d2;
         }
         
-        QTableWidget::item:hover {
+        QTableView::item:hover {
             background-color: #f5f5f5;
         }
         
@@ -348,7 +432,7 @@ class EnhancedThemeManager(QObject):
         QCheckBox::indicator:checked {
             background-color: #fff;
             border-color: #fff;
-            image: url({checkmark_path});
+            image: url(icons:对勾1.png);
         }
         
         /* 单选框样式 */
@@ -374,7 +458,7 @@ class EnhancedThemeManager(QObject):
         QRadioButton::indicator:checked {
             background-color: #fff;
             border-color: #fff;
-            image: url({checkmark_path});
+            image: url(icons:对勾1.png);
         }
         
         /* 分组框样式 - 卡片风格 */
@@ -494,10 +578,10 @@ class EnhancedThemeManager(QObject):
             margin: 4px 0;
         }
         """
-    
-    def get_blue_stylesheet(self) -> str:
-        """获取蓝色专业主题样式表"""
-        return """
+
+
+# 蓝色专业主题样式表
+_BLUE_QSS = """
         /* 蓝色专业主题 - 我很会养猪丶开发版 */
         QMainWindow {
             background-color: #f0f4f8;
@@ -580,7 +664,7 @@ class EnhancedThemeManager(QObject):
         }
         
         /* 表格 - 专业风格 */
-        QTableWidget {
+        QTableView {
             background-color: white;
             alternate-background-color: #f7fafc;
             gridline-color: #e2e8f0;
@@ -590,13 +674,13 @@ class EnhancedThemeManager(QObject):
             font-size: 13px;
         }
         
-        QTableWidget::item {
+        QTableView::item {
             padding: 14px 10px;
             border: none;
             border-bottom: 1px solid #f1f5f9;
         }
         
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #bee3f8, stop:1 #90cdf4);
             color: #1a365d;
@@ -656,7 +740,7 @@ class EnhancedThemeManager(QObject):
         QCheckBox::indicator:checked {
             background-color: #FFF;
             border-color: #FFF;
-            image: url({checkmark_path});
+            image: url(icons:对勾1.png);
         }
         
         /* 单选框样式 - 专业蓝色 */
@@ -682,7 +766,7 @@ class EnhancedThemeManager(QObject):
         QRadioButton::indicator:checked {
             background-color: #fff;
             border-color: #fff;
-            image: url({checkmark_path});
+            image: url(icons:对勾1.png);
         }
         
         /* 分组框 - 专业卡片 */
@@ -716,239 +800,97 @@ class EnhancedThemeManager(QObject):
             font-weight: 500;
         }
         """
+
+
+class ThemeMode(Enum):
+    """主题模式枚举"""
+    LIGHT = "light"
+    DARK = "dark"
+    BLUE = "blue"  # 新增蓝色专业主题
+
+
+# 循环切换时的下一个主题（DARK主题不参与切换）
+_NEXT_THEME = {
+    ThemeMode.LIGHT: ThemeMode.BLUE,
+    ThemeMode.BLUE: ThemeMode.LIGHT
+}
+
+
+class EnhancedThemeManager(QObject):
+    """增强版主题管理器 - 进程内唯一实例，通过 get_enhanced_theme_manager 获取"""
     
-    def get_dark_stylesheet(self) -> str:
-        """获取暗色主题样式表"""
-        return """
-        /* 暗色主题 - 现代化风格 */
-        QMainWindow {
-            background-color: #1a1a1a;
-            color: #ffffff;
-            font-family: "Microsoft YaHei UI", "Segoe UI", Arial, sans-serif;
-        }
-        
-        /* 工具栏 - 暗色风格 */
-        QToolBar {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #2d2d2d, stop:1 #1e1e1e);
-            border: none;
-            border-bottom: 1px solid #404040;
-            padding: 8px;
-            spacing: 6px;
-        }
-        
-        QToolButton {
-            background-color: transparent;
-            border: 1px solid transparent;
-            border-radius: 6px;
-            padding: 10px 18px;
-            margin: 2px;
-            font-weight: 500;
-            font-size: 13px;
-            color: #ffffff;
-            min-width: 90px;
-        }
-        
-        QToolButton:hover {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #404040, stop:1 #353535);
-            border-color: #555555;
-            color: #64b5f6;
-        }
-        
-        QToolButton:pressed {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #353535, stop:1 #2a2a2a);
-        }
-        
-        QToolButton:checked {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #1976d2, stop:1 #1565c0);
-            border-color: ##94c86c;
-        }
-        
-        /* 按钮 - 暗色系 */
-        QPushButton {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #1976d2, stop:1 #1565c0);
-            color: white;
-            border: 1px solid #1565c0;
-            border-radius: 6px;
-            padding: 12px 28px;
-            font-weight: 600;
-            font-size: 13px;
-            min-width: 110px;
-        }
-        
-        QPushButton:hover {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #1565c0, stop:1 #0d47a1);
-        }
-        
-        QPushButton:pressed {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #0d47a1, stop:1 #0a3d62);
-        }
-        
-        QPushButton.secondary {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #2d2d2d, stop:1 #1e1e1e);
-            color: #ffffff;
-            border: 1px solid #404040;
-        }
-        
-        QPushButton.secondary:hover {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #404040, stop:1 #2d2d2d);
-        }
-        
-        /* 表格 - 暗色风格 */
-        QTableWidget {
-            background-color: #2d2d2d;
-            alternate-background-color: #353535;
-            gridline-color: #404040;
-            border: 2px solid #404040;
-            border-radius: 8px;
-            selection-background-color: #1e3a5f;
-            color: #ffffff;
-            font-size: 13px;
-        }
-        
-        QTableWidget::item {
-            padding: 14px 10px;
-            border: none;
-            border-bottom: 1px solid #404040;
-        }
-        
-        QTableWidget::item:selected {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #1e3a5f, stop:1 #1a2f4a);
-            color: #64b5f6;
-        }
-        
-        QHeaderView::section {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #404040, stop:1 #2d2d2d);
-            color: #ffffff;
-            padding: 14px 10px;
-            border: none;
-            border-right: 1px solid #555555;
-            font-weight: 600;
-            font-size: 13px;
-        }
-        
-        QHeaderView::section:hover {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #555555, stop:1 #404040);
-        }
-        
-        /* 输入框 - 暗色样式 */
-        QLineEdit {
-            background-color: #2d2d2d;
-            border: 2px solid #404040;
-            border-radius: 6px;
-            padding: 10px 14px;
-            font-size: 13px;
-            color: #ffffff;
-            selection-background-color: #1976d2;
-        }
-        
-        QLineEdit:focus {
-            border-color: #1976d2;
-            box-shadow: 0 0 0 3px rgba(25, 118, 210, 0.2);
-        }
-        
-        /* 复选框样式 - 暗色 */
-        QCheckBox {
-            spacing: 8px;
-            font-size: 13px;
-            color: #ffffff;
-        }
-        
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border: 2px solid #666666;
-            border-radius: 4px;
-            background-color: #2d2d2d;
-        }
-        
-        QCheckBox::indicator:hover {
-            border-color: #64b5f6;
-            background-color: #404040;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #1976d2;
-            border-color: #1976d2;
-            image: url({checkmark_path});
-        }
-        
-        /* 单选框样式 - 暗色 */
-        QRadioButton {
-            spacing: 8px;
-            font-size: 13px;
-            color: #ffffff;
-        }
-        
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border: 2px solid #666666;
-            border-radius: 9px;
-            background-color: #2d2d2d;
-        }
+    theme_changed = Signal(str)
+    
+    # 主题模式 -> 最终样式表，首次使用某主题时构建；构建结果与实例无关，放在类上共享
+    _stylesheet_cache = {}
+    
+    def __init__(self):
+        super().__init__()
+        self.current_theme = ThemeMode.LIGHT
+        # 样式表中的 icons: 前缀由Qt按此搜索路径解析，样式表本身不含任何文件路径
+        QDir.addSearchPath("icons", get_resource_path("static"))
+        # 最近一次设置到应用上的样式表对象
+        self._applied_stylesheet = None
+        # 应用实例，创建后直到退出都不变，取到后缓存
+        self._app = None
         
-        QRadioButton::indicator:hover {
-            border-color: #64b5f6;
-            background-color: #404040;
-        }
+    def set_theme(self, theme_mode: ThemeMode):
+        """
+        设置主题
         
-        QRadioButton::indicator:checked {
-            background-color: #1976d2;
-            border-color: #1976d2;
-            image: url({checkmark_path});
-        }
+        主题已经生效时直接返回，不重新设置样式表，也不发射 theme_changed
+        """
+        if theme_mode == self.current_theme and self._applied_stylesheet is not None:
+            return
         
-        /* 分组框 - 暗色卡片 */
-        QGroupBox {
-            font-weight: 600;
-            font-size: 14px;
-            color: #ffffff;
-            border: 2px solid #404040;
-            border-radius: 10px;
-            margin-top: 18px;
-            padding-top: 18px;
-            background-color: #2d2d2d;
-        }
+        self.current_theme = theme_mode
         
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 20px;
-            padding: 0 12px;
-            background-color: #2d2d2d;
-            color: #64b5f6;
-            font-weight: 700;
-        }
+        if theme_mode == ThemeMode.BLUE:
+            self._apply(ThemeMode.BLUE)
+        else:
+            self._apply(ThemeMode.LIGHT)  # 默认使用亮色主题
         
-        /* 状态栏 */
-        QStatusBar {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #2d2d2d, stop:1 #1e1e1e);
-            border-top: 2px solid #404040;
-            color: #b0b0b0;
-            font-size: 12px;
-            font-weight: 500;
-        }
-        """
-
+        self.theme_changed.emit(theme_mode.value)
+    
+    def toggle_theme(self):
+        """循环切换主题"""
+        self.set_theme(_NEXT_THEME[self.current_theme])
+    
+    def _apply(self, theme_mode: ThemeMode):
+        """应用主题样式表"""
+        app = self._app
+        if app is None:
+            app = self._app = QApplication.instance()
+        if app:
+            stylesheet = self._stylesheet_cache.get(theme_mode)
+            if stylesheet is None:
+                stylesheet = self._stylesheet_cache[theme_mode] = self._build(theme_mode)
+            # 同一个缓存对象已经生效时不再设置，避免Qt重新解析样式表并重绘所有控件
+            if stylesheet is not self._applied_stylesheet:
+                app.setStyleSheet(stylesheet)
+                self._applied_stylesheet = stylesheet
+    
+    def _build(self, theme_mode: ThemeMode) -> str:
+        """构建主题的最终样式表 - 主题样式附加组件样式后压缩"""
+        stylesheet = self._BUILDERS[theme_mode](self)
+        return _minify_qss(stylesheet + WIDGET_STYLESHEET)
+    
+    def get_light_stylesheet(self) -> str:
+        """获取亮色主题样式表"""
+        return _LIGHT_QSS
+    
+    def get_blue_stylesheet(self) -> str:
+        """获取蓝色专业主题样式表"""
+        return _BLUE_QSS
+    
+    # 主题模式 -> 样式表来源（DARK主题没有独立样式表，set_theme 按亮色主题应用）
+    _BUILDERS = {
+        ThemeMode.LIGHT: get_light_stylesheet,
+        ThemeMode.BLUE: get_blue_stylesheet
+    }
 
-# 全局增强主题管理器实例（延迟初始化）
-enhanced_theme_manager = None
 
-def get_enhanced_theme_manager():
-    """获取增强主题管理器实例（延迟初始化）"""
-    global enhanced_theme_manager
-    if enhanced_theme_manager is None:
-        enhanced_theme_manager = EnhancedThemeManager()
-    return enhanced_theme_manager
+@lru_cache(maxsize=None)
+def get_enhanced_theme_manager() -> EnhancedThemeManager:
+    """获取增强主题管理器实例（延迟初始化，首次调用时创建，之后返回同一实例）"""
+    return EnhancedThemeManager()